@@ -1,16 +1,109 @@
-from django.contrib import admin
+from functools import partial
 
-from .models import Post, Category, Location
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
+from django.core.exceptions import ValidationError
+from django.db.models.functions import Substr
+from django.urls import NoReverseMatch, reverse
+from django.utils.html import format_html
+from django.utils.http import urlencode
+from django.utils.text import Truncator
+
+from .bulk import (
+    delete_comments, delete_posts, move_posts, publish_posts, unpublish_posts
+)
+from .models import Comment, Post, Category, Location, User
+from .paginators import EstimatedCountPaginator
+from .search import search_posts
+
+TEXT_PREVIEW_LENGTH = 100
+
+
+class PreloadedRawIdWidget(ForeignKeyRawIdWidget):
+    related_object = None
+
+    def label_and_url_for_value(self, value):
+        obj = self.related_object
+        if obj is None or str(obj.pk) != str(value):
+            return super().label_and_url_for_value(value)
+        try:
+            url = reverse(
+                f'{self.admin_site.name}:{obj._meta.app_label}_'
+                f'{obj._meta.model_name}_change',
+                args=(obj.pk,)
+            )
+        except NoReverseMatch:
+            url = ''
+        return Truncator(obj).words(14), url
+
+
+class PreloadedRelationsForm(forms.ModelForm):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, field in self.fields.items():
+            if isinstance(field.widget, PreloadedRawIdWidget):
+                field.widget.related_object = getattr(self.instance, name)
+
+
+class RelatedObjectFilter(admin.SimpleListFilter):
+    model = None
+
+    def selected_id(self):
+        value = self.value()
+        return int(value) if value and value.isdigit() else None
+
+    def lookups(self, request, model_admin):
+        if self.selected_id() is None:
+            return []
+        obj = self.model.objects.filter(pk=self.selected_id()).first()
+        return [(str(obj.pk), str(obj))] if obj else []
+
+    def queryset(self, request, queryset):
+        if self.selected_id() is None:
+            return queryset
+        return queryset.filter(
+            **{f'{self.parameter_name}_id': self.selected_id()}
+        )
+
+
+class CommentPostFilter(RelatedObjectFilter):
+    title = 'публикация'
+    parameter_name = 'post'
+    model = Post
+
+
+class CommentAuthorFilter(RelatedObjectFilter):
+    title = 'автор'
+    parameter_name = 'author'
+    model = User
+
+
+class PostActionForm(ActionForm):
+    category = forms.ModelChoiceField(
+        queryset=Category.objects.all(),
+        required=False,
+        label='Категория'
+    )
+
+
+class PostChangeList(ChangeList):
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('text').annotate(
+            text_preview=Substr('text', 1, TEXT_PREVIEW_LENGTH + 1)
+        )
 
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    search_fields = ('text',)
+    search_fields = ('title', 'text')
     list_display = (
         'id',
         'title',
         'author',
-        'text',
+        'short_text',
         'category',
         'pub_date',
         'location',
@@ -23,13 +116,125 @@ class PostAdmin(admin.ModelAdmin):
         'location',
         'is_published',
     )
+    list_select_related = ('author', 'category', 'location')
+    autocomplete_fields = ('author', 'category', 'location')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    action_form = PostActionForm
+    actions = ('publish', 'unpublish', 'move_to_category')
     list_filer = ('created_at', )
     empty_value_display = '-пусто-'
 
+    @admin.display(description='Текст')
+    def short_text(self, post):
+        return Truncator(post.text_preview).chars(TEXT_PREVIEW_LENGTH)
+
+    def get_changelist(self, request, **kwargs):
+        return PostChangeList
+
+    def get_changelist_form(self, request, **kwargs):
+        return super().get_changelist_form(
+            request, form=PreloadedRelationsForm, **kwargs
+        )
+
+    def get_changelist_formset(self, request, **kwargs):
+        return super().get_changelist_formset(
+            request,
+            formfield_callback=partial(
+                self.formfield_for_changelist, request=request
+            ),
+            **kwargs
+        )
+
+    def formfield_for_changelist(self, db_field, request, **kwargs):
+        if db_field.name in self.list_editable and db_field.many_to_one:
+            return db_field.formfield(
+                widget=PreloadedRawIdWidget(
+                    db_field.remote_field, self.admin_site
+                ),
+                **kwargs
+            )
+        return self.formfield_for_dbfield(db_field, request, **kwargs)
+
+    @admin.action(description='Опубликовать выбранные публикации')
+    def publish(self, request, queryset):
+        self.message_user(
+            request, f'Опубликовано публикаций: {publish_posts(queryset)}'
+        )
+
+    @admin.action(description='Снять с публикации выбранные публикации')
+    def unpublish(self, request, queryset):
+        self.message_user(
+            request,
+            f'Снято с публикации публикаций: {unpublish_posts(queryset)}'
+        )
+
+    @admin.action(description='Перенести выбранные публикации в категорию')
+    def move_to_category(self, request, queryset):
+        try:
+            category = self.action_form.base_fields['category'].clean(
+                request.POST.get('category')
+            )
+        except ValidationError:
+            category = None
+        if category is None:
+            self.message_user(
+                request, 'Выберите категорию для переноса.', messages.ERROR
+            )
+            return
+        self.message_user(
+            request,
+            f'Перенесено в «{category}» публикаций: '
+            f'{move_posts(queryset, category)}'
+        )
+
+    def delete_queryset(self, request, queryset):
+        delete_posts(queryset)
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return search_posts(queryset, search_term, prefix=True), False
+
     @admin.register(Category)
     class CategoryAdmin(admin.ModelAdmin):
-        ...
+        search_fields = ('title',)
 
     @admin.register(Location)
     class LocationAdmin(admin.ModelAdmin):
-        ...
+        search_fields = ('name',)
+
+
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    list_display = ('id', 'short_text', 'post_link', 'author_link',
+                    'created_at')
+    list_display_links = ('id', 'short_text')
+    list_select_related = ('author', 'post')
+    list_filter = (CommentPostFilter, CommentAuthorFilter)
+    date_hierarchy = 'created_at'
+    ordering = ('-created_at',)
+    search_fields = ('text',)
+    autocomplete_fields = ('author', 'post')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    @admin.display(description='Текст')
+    def short_text(self, comment):
+        return Truncator(comment.text).chars(TEXT_PREVIEW_LENGTH)
+
+    @admin.display(description='Публикация')
+    def post_link(self, comment):
+        return self.filter_link('post', comment.post)
+
+    @admin.display(description='Автор')
+    def author_link(self, comment):
+        return self.filter_link('author', comment.author)
+
+    def filter_link(self, parameter, obj):
+        return format_html(
+            '<a href="?{}">{}</a>', urlencode({parameter: obj.pk}), obj
+        )
+
+    def delete_queryset(self, request, queryset):
+        delete_comments(queryset)
@@ -1,7 +1,20 @@
 from django.apps import AppConfig
+from django.core.exceptions import ImproperlyConfigured
 
 
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
     verbose_name = 'Блог'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .checks import production_settings_errors
+
+        errors = production_settings_errors()
+        if errors:
+            raise ImproperlyConfigured(
+                'Боевое окружение не может быть запущено:\n' + '\n'.join(
+                    f'{error.id}: {error.msg}' for error in errors
+                )
+            )
@@ -0,0 +1,97 @@
+import threading
+
+import psycopg2.extras
+from django.db import OperationalError
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class BlockingConnectionPool(ThreadedConnectionPool):
+    def __init__(self, minconn, maxconn, *args, timeout=None, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolError(
+                f'Нет свободного соединения в пуле за {self.timeout} с.'
+            )
+        try:
+            return super().getconn(key)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+def discard_pool(key):
+    with _pools_lock:
+        pool = _pools.pop(key, None)
+    if pool is not None:
+        pool.closeall()
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    pool_key = None
+    connection_pool = None
+
+    def get_pool(self, conn_params):
+        key = (self.alias, repr(sorted(conn_params.items())))
+        if self.pool_key not in (None, key):
+            discard_pool(self.pool_key)
+        self.pool_key = key
+        with _pools_lock:
+            if key not in _pools:
+                options = self.settings_dict.get('POOL', {})
+                _pools[key] = BlockingConnectionPool(
+                    options.get('MIN_SIZE', 1),
+                    options.get('MAX_SIZE', 10),
+                    timeout=options.get('TIMEOUT', 30),
+                    **conn_params
+                )
+            return _pools[key]
+
+    def close_pool(self):
+        self.close()
+        if self.pool_key is not None:
+            discard_pool(self.pool_key)
+            self.pool_key = None
+
+    def get_new_connection(self, conn_params):
+        if self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+        pool = self.get_pool(conn_params)
+        try:
+            connection = pool.getconn()
+        except PoolError as error:
+            raise OperationalError(str(error)) from error
+        self.connection_pool = pool
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = options.get(
+            'isolation_level', connection.isolation_level
+        )
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+        psycopg2.extras.register_default_jsonb(
+            conn_or_curs=connection, loads=lambda x: x
+        )
+        return connection
+
+    def _close(self):
+        if self.connection_pool is None:
+            return super()._close()
+        pool, self.connection_pool = self.connection_pool, None
+        with self.wrap_database_errors:
+            if not self.connection.closed:
+                self.connection.reset()
+            pool.putconn(self.connection, close=bool(self.connection.closed))
@@ -0,0 +1,117 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .cache import (
+    invalidate_category_pages, invalidate_post_cards,
+    reset_next_visibility_change
+)
+from .images import release_image
+from .models import Comment, Post
+from .search import remove_posts
+from .storage import post_image_storage
+
+_bulk_changes = ContextVar('bulk_post_changes', default=False)
+
+
+def in_bulk_changes():
+    return _bulk_changes.get()
+
+
+@contextmanager
+def bulk_changes():
+    token = _bulk_changes.set(True)
+    try:
+        yield
+    finally:
+        _bulk_changes.reset(token)
+
+
+def actual_comment_count():
+    return Coalesce(
+        Subquery(
+            Comment.objects.filter(
+                post=OuterRef('pk')
+            ).order_by().values('post').annotate(
+                total=Count('pk')
+            ).values('total'),
+            output_field=IntegerField()
+        ),
+        0
+    )
+
+
+def affected_posts(queryset):
+    rows = list(queryset.order_by().values_list('pk', 'category_id'))
+    post_ids = [post_id for post_id, _ in rows]
+    category_ids = {category_id for _, category_id in rows}
+    return post_ids, category_ids
+
+
+def invalidate_posts(post_ids, category_ids):
+    invalidate_post_cards(post_ids)
+    reset_next_visibility_change()
+    invalidate_category_pages(category_ids)
+
+
+def update_posts(queryset, **fields):
+    with transaction.atomic():
+        post_ids, category_ids = affected_posts(queryset)
+        updated = Post.objects.filter(
+            pk__in=queryset.order_by().values('pk')
+        ).update(**fields)
+    if 'category' in fields:
+        category_ids.add(fields['category'].pk)
+    invalidate_posts(post_ids, category_ids)
+    return updated
+
+
+def publish_posts(queryset):
+    return update_posts(queryset, is_published=True)
+
+
+def unpublish_posts(queryset):
+    return update_posts(queryset, is_published=False)
+
+
+def move_posts(queryset, category):
+    return update_posts(queryset, category=category)
+
+
+def delete_posts(queryset):
+    with transaction.atomic(), bulk_changes():
+        post_ids, category_ids = affected_posts(queryset)
+        images = dict(
+            Post.objects.filter(pk__in=post_ids).exclude(
+                image=''
+            ).values_list('image', 'image_variants')
+        )
+        _, deleted = Post.objects.filter(
+            pk__in=queryset.order_by().values('pk')
+        ).delete()
+        remove_posts(post_ids)
+    for name, variants in images.items():
+        release_image(post_image_storage, name, variants)
+    invalidate_posts(post_ids, category_ids)
+    return deleted.get(Post._meta.label, 0)
+
+
+def delete_comments(queryset):
+    with transaction.atomic(), bulk_changes():
+        post_ids = set(queryset.order_by().values_list(
+            'post_id', flat=True
+        ).distinct())
+        _, deleted = Comment.objects.filter(
+            pk__in=queryset.order_by().values('pk')
+        ).delete()
+        Post.objects.filter(pk__in=post_ids).update(
+            comment_count=actual_comment_count()
+        )
+    invalidate_post_cards(post_ids)
+    invalidate_category_pages(
+        Post.objects.filter(pk__in=post_ids).values('category_id')
+    )
+    return deleted.get(Comment._meta.label, 0)
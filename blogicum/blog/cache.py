@@ -0,0 +1,119 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models import Min
+from django.utils import timezone
+
+from .models import Category, Post
+
+POST_CARD_FRAGMENT = 'post_card'
+NEXT_VISIBILITY_CHANGE_KEY = 'next_visibility_change'
+NEXT_VISIBILITY_CHANGE_TIMEOUT = 60 * 60
+FEEDS_SCOPE = 'feeds'
+INDEX_SCOPE = 'index'
+PAGES_SCOPE = 'pages'
+
+
+def post_card_cache_key(post_id):
+    return make_template_fragment_key(POST_CARD_FRAGMENT, [post_id])
+
+
+def invalidate_post_cards(post_ids):
+    cache.delete_many([post_card_cache_key(post_id) for post_id in post_ids])
+
+
+def category_scope(slug):
+    return f'category:{slug}'
+
+
+def page_cache_scope(resolver_match):
+    if resolver_match.view_name == 'blog:index':
+        return INDEX_SCOPE
+    if resolver_match.view_name == 'blog:category_posts':
+        return category_scope(resolver_match.kwargs['category_slug'])
+    if resolver_match.namespace == 'pages':
+        return PAGES_SCOPE
+    return None
+
+
+def _version_key(scope):
+    return f'page_cache_version:{scope}'
+
+
+def _page_cache_versions(scope):
+    keys = [_version_key(FEEDS_SCOPE), _version_key(scope)]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return versions[keys[0]], versions[keys[1]]
+
+
+def page_cache_key(scope, request):
+    position = '{}:{}'.format(
+        request.GET.get('page', ''), request.GET.get('cursor', '')
+    )
+    digest = hashlib.md5(
+        f'{request.path}|{position}'.encode()
+    ).hexdigest()
+    feeds_version, scope_version = _page_cache_versions(scope)
+    return f'page_cache:{scope}:{feeds_version}:{scope_version}:{digest}'
+
+
+def next_visibility_change():
+    missing = object()
+    next_pub_date = cache.get(NEXT_VISIBILITY_CHANGE_KEY, missing)
+    if next_pub_date is missing or (
+            next_pub_date is not None and next_pub_date <= timezone.now()):
+        next_pub_date = Post.objects.filter(
+            is_published=True,
+            pub_date__gte=timezone.now(),
+            category__is_published=True
+        ).aggregate(next_pub_date=Min('pub_date'))['next_pub_date']
+        cache.set(
+            NEXT_VISIBILITY_CHANGE_KEY,
+            next_pub_date,
+            NEXT_VISIBILITY_CHANGE_TIMEOUT
+        )
+    return next_pub_date
+
+
+def reset_next_visibility_change():
+    cache.delete(NEXT_VISIBILITY_CHANGE_KEY)
+
+
+def cap_timeout(timeout):
+    next_pub_date = next_visibility_change()
+    if next_pub_date is None:
+        return timeout
+    seconds = (next_pub_date - timezone.now()).total_seconds()
+    return max(0, min(timeout, int(seconds) + 1))
+
+
+def page_cache_timeout(scope):
+    if scope == PAGES_SCOPE:
+        return settings.PAGE_CACHE_TIMEOUT
+    return cap_timeout(settings.PAGE_CACHE_TIMEOUT)
+
+
+def page_max_age(scope):
+    if scope == PAGES_SCOPE:
+        return settings.PAGE_MAX_AGE
+    return cap_timeout(settings.PAGE_MAX_AGE)
+
+
+def invalidate_pages(*scopes):
+    cache.set_many(
+        {_version_key(scope): time.time_ns() for scope in scopes}, None
+    )
+
+
+def invalidate_category_pages(category_ids):
+    slugs = Category.objects.filter(
+        pk__in=category_ids
+    ).values_list('slug', flat=True)
+    invalidate_pages(INDEX_SCOPE, *(category_scope(slug) for slug in slugs))
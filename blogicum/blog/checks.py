@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+DEBUG_APPS = ('debug_toolbar',)
+DEBUG_CONTEXT_PROCESSOR = 'django.template.context_processors.debug'
+CACHED_LOADER = 'django.template.loaders.cached.Loader'
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def uses_cached_loader(options):
+    loaders = options.get('loaders')
+    if loaders is None:
+        return not options.get('debug', settings.DEBUG)
+    return any(
+        isinstance(loader, (list, tuple)) and loader[0] == CACHED_LOADER
+        for loader in loaders
+    )
+
+
+def production_settings_errors():
+    if settings.BLOGICUM_ENV != 'prod':
+        return []
+    errors = []
+    if settings.DEBUG:
+        errors.append(Error(
+            'DEBUG включён в боевом окружении.', id='blog.E001'
+        ))
+    debug_apps = [
+        app for app in settings.INSTALLED_APPS + settings.MIDDLEWARE
+        if app.split('.')[0] in DEBUG_APPS
+    ]
+    if debug_apps:
+        errors.append(Error(
+            f'Отладочные приложения включены: {", ".join(debug_apps)}.',
+            id='blog.E002'
+        ))
+    for template in settings.TEMPLATES:
+        options = template.get('OPTIONS', {})
+        if (options.get('debug')
+                or DEBUG_CONTEXT_PROCESSOR in options.get(
+                    'context_processors', ())):
+            errors.append(Error(
+                'Шаблоны используют отладочный режим или контекст-процессор '
+                f'{DEBUG_CONTEXT_PROCESSOR}.',
+                id='blog.E003'
+            ))
+        if not uses_cached_loader(options):
+            errors.append(Error(
+                'Шаблоны загружаются без кеширующего загрузчика.',
+                id='blog.E004'
+            ))
+    if settings.CACHES['default']['BACKEND'] in LOCAL_CACHE_BACKENDS:
+        errors.append(Error(
+            'Кеш по умолчанию не разделяется между процессами.',
+            id='blog.E005'
+        ))
+    if not settings.ALLOWED_HOSTS:
+        errors.append(Error('ALLOWED_HOSTS не задан.', id='blog.E006'))
+    if settings.SECRET_KEY.startswith('django-insecure'):
+        errors.append(Error(
+            'Используется небезопасный SECRET_KEY.', id='blog.E007'
+        ))
+    return errors
+
+
+@register(Tags.security)
+def check_production_settings(app_configs, **kwargs):
+    return production_settings_errors()
@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from .cache import cap_timeout
+
+
+def cache_timeouts(request):
+    return {
+        'post_card_cache_timeout': lambda: cap_timeout(
+            settings.POST_CARD_CACHE_TIMEOUT
+        ),
+    }
@@ -1,8 +1,51 @@
 from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.template.defaultfilters import filesizeformat
 from django.utils import timezone
+from PIL import Image
+
 from .models import Post, Comment, User
 
 
+class LimitedImageField(forms.ImageField):
+    def to_python(self, data):
+        uploaded = forms.FileField.to_python(self, data)
+        if uploaded is None:
+            return None
+        if uploaded.size > settings.MAX_IMAGE_UPLOAD_SIZE:
+            raise ValidationError(
+                'Размер файла не должен превышать %(limit)s.',
+                code='file_too_large',
+                params={'limit': filesizeformat(
+                    settings.MAX_IMAGE_UPLOAD_SIZE
+                )},
+            )
+        if hasattr(uploaded, 'temporary_file_path'):
+            source = uploaded.temporary_file_path()
+        else:
+            source = uploaded
+        try:
+            with Image.open(source) as image:
+                width, height = image.size
+                image_format = image.format
+        except Exception as error:
+            raise ValidationError(
+                self.error_messages['invalid_image'],
+                code='invalid_image',
+            ) from error
+        if width * height > settings.MAX_IMAGE_PIXELS:
+            raise ValidationError(
+                'Картинка слишком большая: не более %(limit)s пикселей.',
+                code='too_many_pixels',
+                params={'limit': settings.MAX_IMAGE_PIXELS},
+            )
+        uploaded.content_type = Image.MIME.get(image_format)
+        if hasattr(uploaded, 'seek') and callable(uploaded.seek):
+            uploaded.seek(0)
+        return uploaded
+
+
 class PostForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -13,6 +56,7 @@ class PostForm(forms.ModelForm):
     class Meta:
         model = Post
         exclude = ('author',)
+        field_classes = {'image': LimitedImageField}
         widgets = {
             'pub_date': forms.DateTimeInput(
                 format='%Y-%m-%dT%H:%M',
@@ -0,0 +1,81 @@
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .models import Post
+from .storage import post_image_storage
+
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+}
+
+
+def variant_name(name, width, image_format):
+    root, _ = posixpath.splitext(name)
+    return f'{root}.{width}w.{image_format}'
+
+
+def open_image(storage, name):
+    with storage.open(name) as source:
+        image = Image.open(source)
+        image.load()
+    return image
+
+
+def strip_metadata(storage, name, image):
+    if not image.getexif() and 'icc_profile' not in image.info:
+        return name, image
+    cleaned = ImageOps.exif_transpose(image)
+    buffer = BytesIO()
+    cleaned.save(buffer, image.format, quality=95)
+    return storage.save(name, ContentFile(buffer.getvalue())), cleaned
+
+
+def generate_variants(storage, name, image=None):
+    if image is None:
+        image = open_image(storage, name)
+    image = ImageOps.exif_transpose(image).convert('RGB')
+    variants = {}
+    for image_format, (pillow_format, _) in FORMATS.items():
+        variants[image_format] = []
+        for width in settings.IMAGE_VARIANT_WIDTHS:
+            if width >= image.width:
+                break
+            resized = image.copy()
+            resized.thumbnail(
+                (width, image.height), Image.Resampling.LANCZOS
+            )
+            buffer = BytesIO()
+            resized.save(buffer, pillow_format,
+                         quality=settings.IMAGE_VARIANT_QUALITY,
+                         optimize=True)
+            variants[image_format].append([width, storage.save(
+                variant_name(name, width, image_format),
+                ContentFile(buffer.getvalue())
+            )])
+    return variants
+
+
+def process_image(name, storage=post_image_storage):
+    name, image = strip_metadata(storage, name, open_image(storage, name))
+    return name, generate_variants(storage, name, image)
+
+
+def variant_names(variants):
+    return [
+        name
+        for image_format in variants.values()
+        for _, name in image_format
+    ]
+
+
+def release_image(storage, name, variants):
+    if not name or Post.objects.filter(image=name).exists():
+        return
+    for variant in variant_names(variants):
+        storage.delete(variant)
+    storage.delete(name)
@@ -0,0 +1,76 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.test import RequestFactory
+from django.utils import timezone
+
+from blog.models import Category, Comment, Post, User
+from blog.views import PostDetailView
+
+
+def legacy_get_object(user, post_id):
+    published_posts = Post.objects.filter(
+        is_published=True,
+        pub_date__lt=timezone.now(),
+        category__is_published=True
+    ).select_related(
+        'location', 'category', 'author'
+    ).annotate(comment_count_total=Count('comments'))
+    user_posts = Post.objects.filter(author=user)
+    return (published_posts | user_posts).get(pk=post_id)
+
+
+def current_get_object(user, post_id):
+    request = RequestFactory().get('/')
+    request.user = user
+    view = PostDetailView()
+    view.setup(request, post_id=post_id)
+    return view.get_object()
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает время получения публикации на странице поста '
+            'до и после оптимизации. Данные создаются во временной '
+            'транзакции и откатываются.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--comments', type=int, default=50000)
+        parser.add_argument('--posts', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=50)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            post, reader = self.populate(options['posts'],
+                                         options['comments'])
+            for name, lookup in (
+                ('До (OR + Count)', legacy_get_object),
+                ('После (pk + select_related)', current_get_object),
+            ):
+                seconds = timeit.timeit(
+                    lambda: lookup(reader, post.pk), number=options['repeat']
+                )
+                self.stdout.write(
+                    f'{name}: {seconds / options["repeat"] * 1000:.2f} мс'
+                )
+            transaction.set_rollback(True)
+
+    def populate(self, posts, comments):
+        author = User.objects.create(username='benchmark_author')
+        reader = User.objects.create(username='benchmark_reader')
+        category = Category.objects.create(
+            title='Benchmark', description='Benchmark', slug='benchmark'
+        )
+        Post.objects.bulk_create(
+            Post(title=f'Post {index}', text='Text', author=author,
+                 category=category, pub_date=timezone.now())
+            for index in range(posts)
+        )
+        post = Post.objects.filter(author=author).first()
+        Comment.objects.bulk_create(
+            (Comment(post=post, author=reader, text='Comment')
+             for _ in range(comments)),
+            batch_size=1000
+        )
+        return post, reader
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+from django.views.static import serve
+
+from blog.media import serve_media
+
+HASHED_NAME = 'ab/cd/' + 'ab' * 32 + '.jpg'
+
+
+def consume(response):
+    for _ in response:
+        pass
+    response.close()
+    return response
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает отдачу медиафайлов стандартным static.serve '
+            'и блоговым serve_media.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=512 * 2 ** 10)
+        parser.add_argument('--requests', type=int, default=500)
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, os.path.dirname(HASHED_NAME)))
+            with open(os.path.join(root, HASHED_NAME), 'wb') as file:
+                file.write(os.urandom(options['size']))
+            with override_settings(MEDIA_ROOT=root):
+                first = consume(serve_media(factory.get('/'), HASHED_NAME))
+                scenarios = (
+                    ('static.serve, полный ответ',
+                     lambda: serve(factory.get('/'), HASHED_NAME,
+                                   document_root=root)),
+                    ('static.serve, If-Modified-Since',
+                     lambda: serve(factory.get(
+                         '/', HTTP_IF_MODIFIED_SINCE=first['Last-Modified']
+                     ), HASHED_NAME, document_root=root)),
+                    ('serve_media, полный ответ',
+                     lambda: serve_media(factory.get('/'), HASHED_NAME)),
+                    ('serve_media, If-None-Match',
+                     lambda: serve_media(factory.get(
+                         '/', HTTP_IF_NONE_MATCH=first['ETag']
+                     ), HASHED_NAME)),
+                    ('serve_media, Range 64 КБ',
+                     lambda: serve_media(factory.get(
+                         '/', HTTP_RANGE='bytes=0-65535'
+                     ), HASHED_NAME)),
+                )
+                for name, view in scenarios:
+                    sent = 0
+                    started = time.perf_counter()
+                    for _ in range(options['requests']):
+                        response = view()
+                        sent += sum(len(chunk) for chunk in response)
+                        response.close()
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f'{name}: код {response.status_code}, '
+                        f'{elapsed / options["requests"] * 1000:.3f} мс '
+                        f'на запрос, '
+                        f'{sent / options["requests"] / 2 ** 10:.0f} КБ '
+                        f'на запрос'
+                    )
@@ -0,0 +1,76 @@
+import json
+import random
+import time
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.search import TOKEN_RE, get_backend, tokenize
+from blog.stemmer import stem
+
+
+def build_corpus(path, size, words_per_post, seed):
+    with open(path, encoding='utf-8') as fixture:
+        posts = [
+            record['fields'] for record in json.load(fixture)
+            if record['model'] == 'blog.post'
+        ]
+    titles = [post['title'] for post in posts]
+    words = [word for post in posts for word in post['text'].split()]
+    generator = random.Random(seed)
+    return [
+        SimpleNamespace(
+            pk=index,
+            title=generator.choice(titles),
+            text=' '.join(generator.choices(words, k=words_per_post)),
+        )
+        for index in range(1, size + 1)
+    ]
+
+
+class Command(BaseCommand):
+    help = ('Измеряет скорость индексации публикаций для поиска на '
+            'синтетическом корпусе из db.json.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fixture', default=settings.BASE_DIR.parent / 'db.json'
+        )
+        parser.add_argument('--posts', type=int, default=5000)
+        parser.add_argument('--words', type=int, default=150)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def measure(self, name, posts, action):
+        started = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{name}: {len(posts) / elapsed:,.0f} публикаций/с '
+            f'({elapsed:.2f} с)'
+        )
+
+    def handle(self, *args, **options):
+        posts = build_corpus(options['fixture'], options['posts'],
+                             options['words'], options['seed'])
+        self.stdout.write(
+            f'Корпус: {len(posts)} публикаций по {options["words"]} слов'
+        )
+        self.measure('Разбиение на слова', posts, lambda: [
+            TOKEN_RE.findall(post.text.lower()) for post in posts
+        ])
+        stem.cache_clear()
+        self.measure('Анализ (холодный кэш основ)', posts, lambda: [
+            tokenize(post.text) for post in posts
+        ])
+        self.measure('Анализ (тёплый кэш основ)', posts, lambda: [
+            tokenize(post.text) for post in posts
+        ])
+        with transaction.atomic():
+            backend = get_backend()
+            backend.drop()
+            backend.create()
+            self.measure('Запись в индекс', posts,
+                         lambda: backend.index(posts))
+            transaction.set_rollback(True)
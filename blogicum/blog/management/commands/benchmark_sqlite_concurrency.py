@@ -0,0 +1,136 @@
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, connections
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.models import Category, Comment, Post, User
+
+PROFILES = (
+    ('По умолчанию (журнал отката, новое соединение на запрос)',
+     {'CONN_MAX_AGE': 0}, {}),
+    ('Настроенный (WAL, постоянные соединения)',
+     {'CONN_MAX_AGE': settings.DATABASES['default'].get('CONN_MAX_AGE')},
+     settings.SQLITE_PRAGMAS),
+)
+
+
+def seed(posts):
+    author = User.objects.create(username='benchmark')
+    category = Category.objects.create(
+        title='Бенчмарк', slug='benchmark', description='-'
+    )
+    Post.objects.bulk_create(
+        Post(
+            title=f'Публикация {index}',
+            text='Текст публикации',
+            author=author,
+            category=category,
+            pub_date=timezone.now(),
+        )
+        for index in range(posts)
+    )
+    return author, list(Post.objects.values_list('pk', flat=True))
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает пропускную способность SQLite при одновременной '
+            'записи комментариев и чтении ленты до и после настройки.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--seconds', type=float, default=5)
+        parser.add_argument('--posts', type=int, default=50)
+
+    def handle(self, *args, **options):
+        database = connections.databases['default']
+        original = dict(database)
+        with tempfile.TemporaryDirectory() as directory:
+            base = Path(directory) / 'base.sqlite3'
+            try:
+                with override_settings(SQLITE_PRAGMAS={}):
+                    self.use_database(database, original, base, {})
+                    call_command('migrate', verbosity=0)
+                    author, post_ids = seed(options['posts'])
+                    connection.close()
+                for index, (name, overrides, pragmas) in enumerate(PROFILES):
+                    path = Path(directory) / f'profile_{index}.sqlite3'
+                    shutil.copy(base, path)
+                    with override_settings(SQLITE_PRAGMAS=pragmas):
+                        self.use_database(database, original, path, overrides)
+                        self.report(name, self.run(author, post_ids, options))
+            finally:
+                connection.close()
+                database.clear()
+                database.update(original)
+
+    def use_database(self, database, original, path, overrides):
+        connection.close()
+        database.clear()
+        database.update(original, NAME=str(path), **overrides)
+
+    def run(self, author, post_ids, options):
+        results = Counter()
+        lock = threading.Lock()
+        deadline = time.monotonic() + options['seconds']
+
+        def write():
+            Comment.objects.create(
+                post_id=random.choice(post_ids),
+                author=author,
+                text='Комментарий под нагрузкой'
+            )
+
+        def read():
+            list(Post.objects.published()[:settings.POSTS_BY_PAGE])
+
+        def worker(kind, action):
+            local = Counter()
+            try:
+                while time.monotonic() < deadline:
+                    try:
+                        action()
+                        local[kind] += 1
+                    except OperationalError:
+                        local[f'{kind}_errors'] += 1
+                    finally:
+                        connection.close_if_unusable_or_obsolete()
+            finally:
+                connection.close()
+                with lock:
+                    results.update(local)
+
+        threads = [
+            threading.Thread(target=worker, args=('writes', write))
+            for _ in range(options['writers'])
+        ] + [
+            threading.Thread(target=worker, args=('reads', read))
+            for _ in range(options['readers'])
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results['elapsed'] = time.monotonic() - started
+        return results
+
+    def report(self, name, results):
+        elapsed = results['elapsed']
+        self.stdout.write(
+            f'{name}:\n'
+            f'  записи: {results["writes"] / elapsed:,.0f} оп/с, '
+            f'ошибок блокировки: {results["writes_errors"]}\n'
+            f'  чтения: {results["reads"] / elapsed:,.0f} оп/с, '
+            f'ошибок блокировки: {results["reads_errors"]}'
+        )
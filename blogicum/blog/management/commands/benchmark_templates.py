@@ -0,0 +1,92 @@
+import time
+from copy import deepcopy
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+
+from blog.cache import invalidate_post_cards
+from blog.models import Category, Post, User
+from blog.views import PostListView
+from blog.warmup import warm_templates
+
+DIRECT_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+CACHED_LOADERS = [('django.template.loaders.cached.Loader', DIRECT_LOADERS)]
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark_templates',
+    }
+}
+
+
+def templates_with_loaders(loaders):
+    templates = deepcopy(settings.TEMPLATES)
+    templates[0]['APP_DIRS'] = False
+    templates[0]['OPTIONS']['loaders'] = loaders
+    return templates
+
+
+def render_feed_page(post_ids):
+    invalidate_post_cards(post_ids)
+    request = RequestFactory().get('/')
+    request.user = AnonymousUser()
+    response = PostListView.as_view()(request)
+    started = time.perf_counter()
+    response.render()
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает время отрисовки страницы ленты без кеширования '
+            'шаблонов и с кеширующим загрузчиком. Данные создаются во '
+            'временной транзакции и откатываются.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=100)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            post_ids = self.populate(options['posts'])
+            for name, loaders, warm in (
+                ('До (без кеширования)', DIRECT_LOADERS, False),
+                ('После (cached.Loader)', CACHED_LOADERS, False),
+                ('После (cached.Loader + прогрев)', CACHED_LOADERS, True),
+            ):
+                with override_settings(
+                    TEMPLATES=templates_with_loaders(loaders),
+                    CACHES=BENCHMARK_CACHES,
+                ):
+                    if warm:
+                        warm_templates()
+                    first = render_feed_page(post_ids)
+                    total = sum(
+                        render_feed_page(post_ids)
+                        for _ in range(options['repeat'])
+                    )
+                self.stdout.write(
+                    f'{name}: первая отрисовка {first * 1000:.2f} мс, '
+                    f'далее {total / options["repeat"] * 1000:.2f} мс'
+                )
+            transaction.set_rollback(True)
+
+    def populate(self, posts):
+        author = User.objects.create(username='benchmark_author')
+        category = Category.objects.create(
+            title='Benchmark', description='Benchmark', slug='benchmark'
+        )
+        Post.objects.bulk_create(
+            Post(title=f'Post {index}', text='Text ' * 50, author=author,
+                 category=category, pub_date=timezone.now())
+            for index in range(posts)
+        )
+        return list(
+            Post.objects.filter(author=author).values_list('pk', flat=True)
+        )
@@ -0,0 +1,87 @@
+import threading
+import time
+import tracemalloc
+from io import BytesIO
+
+from django import forms
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler, TemporaryFileUploadHandler
+)
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from PIL import Image
+
+from blog.forms import LimitedImageField
+from blog.uploads import LimitedTemporaryFileUploadHandler
+
+SCENARIOS = (
+    (
+        'До (стандартные обработчики + ImageField)',
+        (MemoryFileUploadHandler, TemporaryFileUploadHandler),
+        forms.ImageField,
+    ),
+    (
+        'После (потоковая запись + ленивая проверка)',
+        (LimitedTemporaryFileUploadHandler,),
+        LimitedImageField,
+    ),
+)
+
+
+def make_image(megapixels):
+    side = int((megapixels * 10 ** 6) ** 0.5)
+    buffer = BytesIO()
+    Image.effect_noise((side, side), 64).convert('RGB').save(
+        buffer, 'JPEG', quality=85
+    )
+    return SimpleUploadedFile('upload.jpg', buffer.getvalue())
+
+
+class Command(BaseCommand):
+    help = ('Измеряет пиковое потребление памяти при одновременной '
+            'загрузке картинок до и после потоковой обработки.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--megapixels', type=float, default=6)
+        parser.add_argument('--concurrency', type=int, default=8)
+
+    def handle(self, *args, **options):
+        upload = make_image(options['megapixels'])
+        self.stdout.write(
+            f'Файл: {upload.size / 2 ** 20:.1f} МБ, '
+            f'потоков: {options["concurrency"]}'
+        )
+        for name, handlers, field_class in SCENARIOS:
+            requests = []
+            for _ in range(options['concurrency']):
+                upload.seek(0)
+                requests.append(RequestFactory().generic(
+                    'POST', '/',
+                    encode_multipart(BOUNDARY, {'image': upload}),
+                    content_type=MULTIPART_CONTENT
+                ))
+            tracemalloc.start()
+            started = time.perf_counter()
+            threads = [
+                threading.Thread(
+                    target=self.upload,
+                    args=(request, handlers, field_class)
+                )
+                for request in requests
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.stdout.write(
+                f'{name}: пик {peak / 2 ** 20:.1f} МБ, {elapsed:.2f} с'
+            )
+
+    def upload(self, request, handlers, field_class):
+        request.upload_handlers = [handler(request) for handler in handlers]
+        field_class().clean(request.FILES['image'])
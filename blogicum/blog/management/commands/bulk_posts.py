@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from blog.bulk import delete_posts, move_posts, publish_posts, unpublish_posts
+from blog.models import Category, Post
+from blog.search import search_posts
+
+ACTIONS = ('publish', 'unpublish', 'move', 'delete')
+
+
+def datetime_argument(value):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(value)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = ('Публикует, снимает с публикации, переносит или удаляет '
+            'публикации по фильтру одним пакетом.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=ACTIONS)
+        parser.add_argument('--ids', type=int, nargs='+')
+        parser.add_argument('--author', help='Имя пользователя автора.')
+        parser.add_argument('--category', help='Слаг текущей категории.')
+        parser.add_argument('--search', help='Поисковый запрос.')
+        parser.add_argument('--before', type=datetime_argument,
+                            help='Дата публикации раньше указанной.')
+        parser.add_argument('--after', type=datetime_argument,
+                            help='Дата публикации позже указанной.')
+        parser.add_argument('--to-category',
+                            help='Слаг категории для действия move.')
+        parser.add_argument('--all', action='store_true',
+                            help='Разрешить действие без фильтров.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Только посчитать подходящие публикации.')
+
+    def get_queryset(self, options):
+        queryset = Post.objects.all()
+        filters = {
+            'pk__in': options['ids'],
+            'author__username': options['author'],
+            'category__slug': options['category'],
+            'pub_date__lt': options['before'],
+            'pub_date__gt': options['after'],
+        }
+        filters = {
+            lookup: value for lookup, value in filters.items()
+            if value is not None
+        }
+        if not filters and not options['search'] and not options['all']:
+            raise CommandError(
+                'Укажите хотя бы один фильтр или флаг --all.'
+            )
+        queryset = queryset.filter(**filters)
+        if options['search']:
+            queryset = search_posts(queryset, options['search'])
+        return queryset
+
+    def handle(self, *args, **options):
+        queryset = self.get_queryset(options)
+        action = options['action']
+        if action == 'move':
+            if not options['to_category']:
+                raise CommandError('Для move укажите --to-category.')
+            try:
+                category = Category.objects.get(slug=options['to_category'])
+            except Category.DoesNotExist:
+                raise CommandError(
+                    f'Категория «{options["to_category"]}» не найдена.'
+                )
+        if options['dry_run']:
+            self.stdout.write(f'Подходит публикаций: {queryset.count()}')
+            return
+        if action == 'publish':
+            changed = publish_posts(queryset)
+        elif action == 'unpublish':
+            changed = unpublish_posts(queryset)
+        elif action == 'move':
+            changed = move_posts(queryset, category)
+        else:
+            changed = delete_posts(queryset)
+        self.stdout.write(self.style.SUCCESS(
+            f'{action}: обработано публикаций: {changed}'
+        ))
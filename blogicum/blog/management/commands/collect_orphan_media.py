@@ -0,0 +1,55 @@
+import posixpath
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from blog.images import variant_names
+from blog.models import ImageTask, Post
+from blog.storage import post_image_storage
+
+
+def walk(storage, directory=''):
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield posixpath.join(directory, name)
+    for subdirectory in directories:
+        yield from walk(storage, posixpath.join(directory, subdirectory))
+
+
+class Command(BaseCommand):
+    help = ('Удаляет из хранилища картинки и их копии, на которые '
+            'не ссылается ни одна публикация.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace',
+            type=int,
+            default=60 * 60,
+            help='Не трогать файлы моложе этого числа секунд.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать файлы, которые будут удалены.',
+        )
+
+    def handle(self, *args, **options):
+        storage = post_image_storage
+        referenced = set(ImageTask.objects.values_list('image', flat=True))
+        for image, variants in Post.objects.exclude(
+                image='').values_list('image', 'image_variants').iterator():
+            referenced.add(image)
+            referenced.update(variant_names(variants))
+        cutoff = timezone.now() - timedelta(seconds=options['grace'])
+        removed = 0
+        for name in walk(storage):
+            if name in referenced or storage.get_modified_time(name) > cutoff:
+                continue
+            self.stdout.write(name)
+            if not options['dry_run']:
+                storage.delete(name)
+            removed += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Файлов без ссылок: {removed}'
+        ))
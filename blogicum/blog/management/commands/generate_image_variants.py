@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from blog.bulk import invalidate_posts
+from blog.images import generate_variants
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Создаёт уменьшенные копии картинок у существующих публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Пересоздать копии, даже если они уже есть.',
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').only(
+            'image', 'image_variants', 'category_id'
+        )
+        if not options['force']:
+            posts = posts.filter(image_variants={})
+        post_ids, category_ids = [], set()
+        for post in posts.iterator():
+            try:
+                variants = generate_variants(post.image.storage,
+                                             post.image.name)
+            except (OSError, ValueError) as error:
+                self.stderr.write(f'{post.pk}: {error}')
+                continue
+            Post.objects.filter(pk=post.pk).update(image_variants=variants)
+            post_ids.append(post.pk)
+            category_ids.add(post.category_id)
+        if post_ids:
+            invalidate_posts(post_ids, category_ids)
+        self.stdout.write(self.style.SUCCESS(
+            f'Обработано публикаций: {len(post_ids)}'
+        ))
@@ -0,0 +1,55 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blog.images import process_image
+from blog.tasks import claim_tasks, complete_task, fail_task
+
+
+class Command(BaseCommand):
+    help = 'Обрабатывает загруженные картинки публикаций в пуле процессов.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.IMAGE_TASK_WORKERS,
+            help='Количество процессов-обработчиков.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Обработать накопившиеся задачи и завершиться.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Пауза между опросами очереди, в секундах.',
+        )
+
+    def handle(self, *args, **options):
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            while True:
+                tasks = claim_tasks(options['workers'] * 2)
+                if not tasks and options['once']:
+                    return
+                if not tasks:
+                    time.sleep(options['poll_interval'])
+                    continue
+                futures = [
+                    (task, pool.submit(process_image, task.image))
+                    for task in tasks
+                ]
+                for task, future in futures:
+                    try:
+                        complete_task(task, *future.result())
+                    except Exception as error:
+                        fail_task(task, error)
+                        self.stderr.write(f'{task.image}: {error}')
+                    else:
+                        self.stdout.write(f'{task.image}: готово')
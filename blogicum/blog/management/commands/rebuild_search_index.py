@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from blog.models import Post
+from blog.search import BATCH_SIZE, get_backend
+
+
+class Command(BaseCommand):
+    help = 'Пересобирает полнотекстовый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        database = options['database']
+        posts = Post.objects.using(database)
+        with transaction.atomic(using=database):
+            get_backend(connections[database]).rebuild(
+                posts.only('title', 'text').iterator(chunk_size=BATCH_SIZE)
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Проиндексировано публикаций: {posts.count()}'
+        ))
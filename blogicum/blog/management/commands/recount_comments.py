@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from blog.bulk import actual_comment_count, affected_posts, invalidate_posts
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённое количество комментариев у публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать публикации с расхождениями.',
+        )
+
+    def handle(self, *args, **options):
+        drifted = Post.objects.annotate(
+            actual=actual_comment_count()
+        ).exclude(comment_count=F('actual'))
+        if options['dry_run']:
+            for post_id, stored, actual in drifted.values_list(
+                    'pk', 'comment_count', 'actual'):
+                self.stdout.write(f'{post_id}: {stored} -> {actual}')
+            return
+        with transaction.atomic():
+            post_ids, category_ids = affected_posts(drifted)
+            repaired = Post.objects.filter(
+                pk__in=post_ids
+            ).update(comment_count=actual_comment_count())
+        if post_ids:
+            invalidate_posts(post_ids, category_ids)
+        self.stdout.write(self.style.SUCCESS(
+            f'Исправлено публикаций: {repaired}'
+        ))
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = ('Заранее разбирает все шаблоны из каталога templates/, чтобы '
+            'кеширующий загрузчик не делал этого на первых запросах.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        names = warm_templates()
+        self.stdout.write(self.style.SUCCESS(
+            f'Разобрано шаблонов: {len(names)} за '
+            f'{(time.perf_counter() - started) * 1000:.1f} мс'
+        ))
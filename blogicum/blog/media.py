@@ -0,0 +1,120 @@
+import mimetypes
+import os
+import re
+from email.utils import formatdate
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (
+    FileResponse, Http404, HttpResponse, StreamingHttpResponse
+)
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+
+HASHED_NAME_RE = re.compile(r'^[0-9a-f]{64}\.\w+$')
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 2 ** 10
+
+
+def parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start:
+        start, end = int(start), min(int(end) if end else size - 1, size - 1)
+    else:
+        start, end = max(size - int(end), 0), size - 1
+    if start > end:
+        raise ValueError
+    return start, end
+
+
+def read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+            yield chunk
+
+
+def offload(response, path, fullpath):
+    if settings.MEDIA_SENDFILE_HEADER == 'X-Accel-Redirect':
+        response['X-Accel-Redirect'] = (
+            settings.MEDIA_ACCEL_REDIRECT_PREFIX + path
+        )
+    else:
+        response['X-Sendfile'] = fullpath
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        fullpath = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    try:
+        stat = os.stat(fullpath)
+    except OSError:
+        raise Http404
+    if not os.path.isfile(fullpath):
+        raise Http404
+    name = os.path.basename(fullpath)
+    immutable = bool(HASHED_NAME_RE.match(name))
+    etag = quote_etag(
+        name.split('.')[0] if immutable
+        else f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+    )
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if response is None:
+        response = build_response(request, path, fullpath, stat.st_size,
+                                  etag)
+    response['ETag'] = etag
+    response['Last-Modified'] = formatdate(stat.st_mtime, usegmt=True)
+    response['Accept-Ranges'] = 'bytes'
+    if immutable:
+        patch_cache_control(response, public=True, immutable=True,
+                            max_age=365 * 24 * 60 * 60)
+    else:
+        patch_cache_control(response, public=True,
+                            max_age=settings.MEDIA_MAX_AGE)
+    return response
+
+
+def build_response(request, path, fullpath, size, etag):
+    content_type = mimetypes.guess_type(fullpath)[0]
+    content_type = content_type or 'application/octet-stream'
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    if 'Range' in request.headers and if_range in (None, etag):
+        try:
+            byte_range = parse_range(request.headers['Range'], size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+    if settings.MEDIA_SENDFILE_HEADER and byte_range is None:
+        response = HttpResponse(content_type=content_type)
+        return offload(response, path, fullpath)
+    if byte_range is None:
+        response = FileResponse(open(fullpath, 'rb'),
+                                content_type=content_type)
+        response['Content-Length'] = size
+        return response
+    start, end = byte_range
+    response = StreamingHttpResponse(
+        read_range(fullpath, start, end - start + 1),
+        status=206,
+        content_type=content_type
+    )
+    response['Content-Length'] = end - start + 1
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
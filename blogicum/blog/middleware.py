@@ -0,0 +1,71 @@
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import Resolver404, resolve
+from django.utils.cache import patch_cache_control
+
+from .cache import (
+    page_cache_key, page_cache_scope, page_cache_timeout, page_max_age
+)
+from .routers import PRIMARY_PIN_COOKIE, primary_reads, route_reads
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        replica = None
+        if (settings.DATABASE_REPLICAS
+                and request.method in ('GET', 'HEAD')
+                and PRIMARY_PIN_COOKIE not in request.COOKIES):
+            replica = random.choice(settings.DATABASE_REPLICAS)
+        with route_reads(replica) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
+
+
+class AnonymousPageCacheMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        scope = self.get_scope(request)
+        if scope is None:
+            return self.get_response(request)
+        key = page_cache_key(scope, request)
+        response = cache.get(key)
+        if response is not None:
+            response['X-Cache'] = 'HIT'
+            patch_cache_control(response, public=True,
+                                max_age=page_max_age(scope))
+            return response
+        with primary_reads():
+            response = self.get_response(request)
+        response['X-Cache'] = 'MISS'
+        if response.status_code != 200 or response.streaming:
+            return response
+        timeout = page_cache_timeout(scope)
+        if timeout:
+            cache.set(key, response, timeout)
+        patch_cache_control(response, public=True,
+                            max_age=page_max_age(scope))
+        return response
+
+    def get_scope(self, request):
+        if (request.method not in ('GET', 'HEAD')
+                or request.user.is_authenticated):
+            return None
+        try:
+            return page_cache_scope(resolve(request.path_info))
+        except Resolver404:
+            return None
@@ -0,0 +1,66 @@
+from itertools import islice
+
+from django.db import migrations
+
+SEARCH_TABLE = 'blog_post_search'
+BATCH_SIZE = 500
+
+CREATE_SQL = {
+    'sqlite': (
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} '
+        "USING fts5(title, text, tokenize='unicode61 remove_diacritics 2')",
+    ),
+    'postgresql': (
+        f'CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ('
+        'post_id bigint PRIMARY KEY REFERENCES blog_post (id) '
+        'ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+        'document tsvector NOT NULL)',
+        f'CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document_idx '
+        f'ON {SEARCH_TABLE} USING GIN (document)',
+    ),
+}
+
+INSERT_SQL = {
+    'sqlite': (
+        f'INSERT INTO {SEARCH_TABLE} (rowid, title, text) '
+        'VALUES (%s, %s, %s)'
+    ),
+    'postgresql': (
+        f'INSERT INTO {SEARCH_TABLE} (post_id, document) VALUES ('
+        "%s, setweight(to_tsvector('russian', %s), 'A') || "
+        "setweight(to_tsvector('russian', %s), 'B'))"
+    ),
+}
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor not in CREATE_SQL:
+        return
+    Post = apps.get_model('blog', 'Post')
+    rows = Post.objects.values_list('pk', 'title', 'text').iterator(
+        chunk_size=BATCH_SIZE
+    )
+    with schema_editor.connection.cursor() as cursor:
+        for statement in CREATE_SQL[vendor]:
+            cursor.execute(statement)
+        while batch := list(islice(rows, BATCH_SIZE)):
+            cursor.executemany(INSERT_SQL[vendor], batch)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in CREATE_SQL:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_content_addressed_images'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
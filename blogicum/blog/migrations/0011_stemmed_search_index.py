@@ -0,0 +1,39 @@
+from django.db import migrations
+
+SEARCH_TABLE = 'blog_post_search'
+
+CREATE_SQL = {
+    'sqlite': (
+        f'CREATE VIRTUAL TABLE {SEARCH_TABLE} '
+        "USING fts5(title, text, tokenize='unicode61')",
+    ),
+    'postgresql': (
+        f'CREATE TABLE {SEARCH_TABLE} ('
+        'post_id bigint PRIMARY KEY REFERENCES blog_post (id) '
+        'ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+        'document tsvector NOT NULL)',
+        f'CREATE INDEX {SEARCH_TABLE}_document_idx '
+        f'ON {SEARCH_TABLE} USING GIN (document)',
+    ),
+}
+
+
+def recreate_search_table(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor not in CREATE_SQL:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+        for statement in CREATE_SQL[vendor]:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_post_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(recreate_search_table, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,12 @@
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 
 from .forms import PostForm
 from .models import Post, Comment
+from .paginators import CursorPaginator
 
 
 class PostMixin:
@@ -26,3 +30,25 @@ class CommentMixin:
     def get_success_url(self):
         return reverse_lazy('blog:post_detail',
                             kwargs={'post_id': self.kwargs['post_id']})
+
+
+class CursorPaginationMixin:
+    paginate_by = settings.POSTS_BY_PAGE
+    cursor_pagination = settings.CURSOR_PAGINATION
+    cursor_kwarg = 'cursor'
+    cursor_field = 'pub_date'
+    cursor_descending = True
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.cursor_pagination:
+            return super().paginate_queryset(queryset, page_size)
+        try:
+            page = CursorPaginator(
+                queryset,
+                page_size,
+                field=self.cursor_field,
+                descending=self.cursor_descending
+            ).page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as error:
+            raise Http404(str(error))
+        return None, page, page.object_list, page.has_other_pages()
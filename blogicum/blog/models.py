@@ -1,25 +1,38 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from .storage import post_image_storage
+
 User = get_user_model()
 
 
 class PostQuerySet(models.QuerySet):
+    def with_related(self):
+        return self.select_related(
+            'location',
+            'category',
+            'author',
+        ).order_by('-pub_date')
+
     def published(self):
         return self.filter(
             is_published=True,
             pub_date__lt=timezone.now(),
             category__is_published=True
-        ).select_related(
-            'location',
-            'category',
-            'author',
-        ).annotate(
-            comment_count=Count('comments')
-        ).order_by('-pub_date')
+        ).with_related()
+
+    def summary(self):
+        return self.order_by().aggregate(
+            post_total=Count('pk'),
+            comment_total=Coalesce(Sum('comment_count'), 0),
+            last_activity=Max(
+                'pub_date', filter=Q(pub_date__lte=timezone.now())
+            ),
+        )
 
 
 class PublishedPostManager(models.Manager):
@@ -29,6 +42,9 @@ class PublishedPostManager(models.Manager):
     def published(self):
         return self.get_queryset().published()
 
+    def with_related(self):
+        return self.get_queryset().with_related()
+
 
 class CreatedAtModel(models.Model):
     created_at = models.DateTimeField(
@@ -118,7 +134,30 @@ class Post(IsPublishedModel, CreatedAtModel):
     )
     image = models.ImageField(
         verbose_name='Картинка у публикации',
-        blank=True
+        blank=True,
+        storage=post_image_storage
+    )
+    image_status = models.CharField(
+        max_length=16,
+        choices=(
+            ('ready', 'Готова'),
+            ('pending', 'Обрабатывается'),
+            ('failed', 'Ошибка обработки'),
+        ),
+        default='ready',
+        editable=False,
+        verbose_name='Состояние картинки'
+    )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Уменьшенные копии картинки'
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
     )
 
     objects = PublishedPostManager()
@@ -128,10 +167,35 @@ class Post(IsPublishedModel, CreatedAtModel):
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date', )
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=Q(is_published=True),
+                name='post_published_feed_idx'
+            ),
+            models.Index(
+                fields=('category', '-pub_date'),
+                name='post_category_feed_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date'),
+                name='post_author_feed_idx'
+            ),
+        )
 
     def __str__(self) -> str:
         return self.title[:settings.REPRESENTATION_LENGTH]
 
+    def is_visible_to(self, user):
+        if self.author_id == user.pk:
+            return True
+        return (
+            self.is_published
+            and self.pub_date < timezone.now()
+            and self.category is not None
+            and self.category.is_published
+        )
+
 
 class Comment(CreatedAtModel):
     author = models.ForeignKey(
@@ -154,6 +218,51 @@ class Comment(CreatedAtModel):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         ordering = ('created_at',)
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_idx'
+            ),
+            models.Index(
+                fields=('-created_at',),
+                name='comment_created_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:settings.REPRESENTATION_LENGTH]
+
+
+class ImageTask(CreatedAtModel):
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        verbose_name='Публикация',
+        related_name='image_task',
+    )
+    image = models.CharField(
+        max_length=settings.MAX_FIELD_LENGTH,
+        verbose_name='Файл картинки'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Попыток'
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Не раньше'
+    )
+    locked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Взята в работу'
+    )
+    error = models.TextField(blank=True, verbose_name='Последняя ошибка')
+
+    class Meta:
+        verbose_name = 'обработка картинки'
+        verbose_name_plural = 'Обработка картинок'
+        ordering = ('run_after',)
+
+    def __str__(self):
+        return self.image[:settings.REPRESENTATION_LENGTH]
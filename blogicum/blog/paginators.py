@@ -0,0 +1,150 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+FORWARD = 'n'
+BACKWARD = 'p'
+
+
+def encode_cursor(direction, value, pk):
+    raw = f'{direction}|{value.isoformat()}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(
+            cursor + '=' * (-len(cursor) % 4)
+        ).decode()
+        direction, value, pk = raw.split('|')
+        if direction not in (FORWARD, BACKWARD):
+            raise ValueError
+        return direction, datetime.fromisoformat(value), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidPage('Некорректный курсор')
+
+
+class CursorPage:
+    cursor_based = True
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    def __init__(self, queryset, per_page, field='pub_date',
+                 descending=True):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.field = field
+        self.descending = descending
+
+    def page(self, cursor=None):
+        if not cursor:
+            items = self._slice(self.queryset, self.descending)
+            return self._build_page(items[:self.per_page],
+                                    has_next=len(items) > self.per_page,
+                                    has_previous=False)
+        direction, value, pk = decode_cursor(cursor)
+        if direction == FORWARD:
+            items = self._slice(
+                self._after(value, pk, self.descending), self.descending
+            )
+            return self._build_page(items[:self.per_page],
+                                    has_next=len(items) > self.per_page,
+                                    has_previous=True)
+        items = self._slice(
+            self._after(value, pk, not self.descending), not self.descending
+        )
+        return self._build_page(items[:self.per_page][::-1],
+                                has_next=True,
+                                has_previous=len(items) > self.per_page)
+
+    def _after(self, value, pk, descending):
+        lookup = 'lt' if descending else 'gt'
+        return self.queryset.filter(
+            Q(**{f'{self.field}__{lookup}': value})
+            | Q(**{self.field: value, f'pk__{lookup}': pk})
+        )
+
+    def _slice(self, queryset, descending):
+        prefix = '-' if descending else ''
+        return list(queryset.order_by(
+            f'{prefix}{self.field}', f'{prefix}pk'
+        )[:self.per_page + 1])
+
+    def _build_page(self, items, has_next, has_previous):
+        if not items:
+            return CursorPage(items)
+        first, last = items[0], items[-1]
+        return CursorPage(
+            items,
+            next_cursor=encode_cursor(
+                FORWARD, getattr(last, self.field), last.pk
+            ) if has_next else None,
+            previous_cursor=encode_cursor(
+                BACKWARD, getattr(first, self.field), first.pk
+            ) if has_previous else None,
+        )
+
+
+def estimate_count(queryset):
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class '
+                'WHERE oid = %s::regclass',
+                [table]
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute(
+                'SELECT CAST(stat AS INTEGER) FROM sqlite_stat1 '
+                'WHERE tbl = %s LIMIT 1',
+                [table]
+            )
+        else:
+            return None
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+class EstimatedCountPaginator(Paginator):
+    estimate_threshold = 10_000
+
+    @cached_property
+    def count(self):
+        if (isinstance(self.object_list, QuerySet)
+                and not self.object_list.query.where):
+            estimate = estimate_count(self.object_list)
+            if estimate and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
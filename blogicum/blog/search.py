@@ -0,0 +1,199 @@
+import re
+from itertools import islice
+
+from django.db import connection as default_connection, connections
+from django.db.models import Q
+
+from .stemmer import stem
+
+SEARCH_TABLE = 'blog_post_search'
+TOKEN_RE = re.compile(r'\w+')
+BATCH_SIZE = 500
+STOPWORDS = frozenset('''
+    а без более бы был была были было быть в вам вас весь во вот все всего
+    всех вы где да даже для до его ее ей ему если есть еще же за здесь и из
+    или им их к как ко когда кто ли либо мне может мы на надо наш не него нее
+    нет ни них но ну о об однако он она они оно от очень по под при с со так
+    также такой там те тем то того тоже той только том ты у уже хотя чего чей
+    чем что чтобы чье чья эта эти это я
+'''.split())
+
+
+def tokenize(text, prefix=False):
+    return [
+        stem(token)
+        for token in TOKEN_RE.findall(text.lower().replace('ё', 'е'))
+        if prefix or token not in STOPWORDS
+    ]
+
+
+def analyze(text):
+    return ' '.join(tokenize(text))
+
+
+class SearchBackend:
+    supported = False
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def create(self):
+        with self.connection.cursor() as cursor:
+            for statement in self.create_sql:
+                cursor.execute(statement)
+
+    def drop(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def rebuild(self, posts):
+        self.drop()
+        self.create()
+        self.index(posts)
+
+    def index(self, posts):
+        posts = iter(posts)
+        with self.connection.cursor() as cursor:
+            while batch := [
+                (post.pk, analyze(post.title), analyze(post.text))
+                for post in islice(posts, BATCH_SIZE)
+            ]:
+                self.write(cursor, batch)
+
+    def remove(self, post_ids):
+        post_ids = iter(post_ids)
+        with self.connection.cursor() as cursor:
+            while batch := list(islice(post_ids, BATCH_SIZE)):
+                placeholders = ', '.join(['%s'] * len(batch))
+                cursor.execute(
+                    f'DELETE FROM {SEARCH_TABLE} '
+                    f'WHERE {self.key_column} IN ({placeholders})',
+                    batch
+                )
+
+    def filter(self, queryset, terms, prefix=False):
+        table = queryset.model._meta.db_table
+        query = self.query(terms, prefix)
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[
+                f'{SEARCH_TABLE}.{self.key_column} = {table}.id',
+                self.match_sql,
+            ],
+            params=[query],
+            select={'rank': self.rank_sql},
+            select_params=self.rank_params(query),
+        ).order_by('-rank', '-pub_date')
+
+
+class SQLiteSearchBackend(SearchBackend):
+    supported = True
+    key_column = 'rowid'
+    create_sql = (
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} '
+        "USING fts5(title, text, tokenize='unicode61')",
+    )
+    match_sql = f'{SEARCH_TABLE} MATCH %s'
+    rank_sql = f'-bm25({SEARCH_TABLE}, 10.0, 1.0)'
+
+    def write(self, cursor, rows):
+        cursor.executemany(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s',
+            [(pk,) for pk, *_ in rows]
+        )
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, title, text) '
+            'VALUES (%s, %s, %s)',
+            rows
+        )
+
+    def query(self, terms, prefix=False):
+        suffix = '*' if prefix else ''
+        return ' '.join(f'"{term}"{suffix}' for term in terms)
+
+    def rank_params(self, query):
+        return []
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    supported = True
+    key_column = 'post_id'
+    config = 'simple'
+    create_sql = (
+        f'CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ('
+        'post_id bigint PRIMARY KEY REFERENCES blog_post (id) '
+        'ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+        'document tsvector NOT NULL)',
+        f'CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document_idx '
+        f'ON {SEARCH_TABLE} USING GIN (document)',
+    )
+    match_sql = (
+        f"{SEARCH_TABLE}.document @@ to_tsquery('{config}', %s)"
+    )
+    rank_sql = (
+        f"ts_rank_cd({SEARCH_TABLE}.document, to_tsquery('{config}', %s))"
+    )
+
+    def write(self, cursor, rows):
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (post_id, document) VALUES ('
+            f"%s, setweight(to_tsvector('{self.config}', %s), 'A') || "
+            f"setweight(to_tsvector('{self.config}', %s), 'B')) "
+            'ON CONFLICT (post_id) DO UPDATE SET document = EXCLUDED.document',
+            rows
+        )
+
+    def query(self, terms, prefix=False):
+        suffix = ':*' if prefix else ''
+        return ' & '.join(f'{term}{suffix}' for term in terms)
+
+    def rank_params(self, query):
+        return [query]
+
+
+class FallbackSearchBackend(SearchBackend):
+    def create(self):
+        pass
+
+    def drop(self):
+        pass
+
+    def index(self, posts):
+        pass
+
+    def remove(self, post_ids):
+        pass
+
+    def filter(self, queryset, terms, prefix=False):
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(text__icontains=term)
+        return queryset.filter(condition)
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgreSQLSearchBackend,
+}
+
+
+def get_backend(connection=None):
+    connection = connection or default_connection
+    return BACKENDS.get(connection.vendor, FallbackSearchBackend)(connection)
+
+
+def index_posts(posts, connection=None):
+    get_backend(connection).index(posts)
+
+
+def remove_posts(post_ids, connection=None):
+    get_backend(connection).remove(post_ids)
+
+
+def search_posts(queryset, query, prefix=False):
+    terms = tokenize(query, prefix)
+    if not terms:
+        return queryset.none()
+    return get_backend(connections[queryset.db]).filter(
+        queryset, terms, prefix
+    )
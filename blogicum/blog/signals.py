@@ -0,0 +1,160 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+
+from .bulk import in_bulk_changes
+from .cache import (
+    FEEDS_SCOPE, INDEX_SCOPE, category_scope, invalidate_category_pages,
+    invalidate_pages, invalidate_post_cards, reset_next_visibility_change
+)
+from .images import release_image
+from .models import Category, Comment, Location, Post
+from .search import index_posts, remove_posts
+from .tasks import enqueue_image_task, run_task
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+        invalidate_comment_post(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    if in_bulk_changes():
+        return
+    Post.objects.filter(
+        pk=instance.post_id,
+        comment_count__gt=0
+    ).update(comment_count=F('comment_count') - 1)
+    invalidate_comment_post(instance)
+
+
+def invalidate_comment_post(comment):
+    invalidate_post_cards([comment.post_id])
+    invalidate_category_pages(
+        Post.objects.filter(pk=comment.post_id).values('category_id')
+    )
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_state(sender, instance, **kwargs):
+    instance._previous_category_id, instance._previous_image = (
+        Post.objects.filter(pk=instance.pk).values_list(
+            'category_id', 'image'
+        ).first() or (None, '')
+    )
+
+
+@receiver(post_save, sender=Post)
+def update_image_variants(sender, instance, raw=False, **kwargs):
+    if raw or instance.image.name == instance._previous_image:
+        return
+    release_image(instance.image.storage, instance._previous_image,
+                  instance.image_variants)
+    instance.image_variants = {}
+    instance.image_status = 'pending' if instance.image else 'ready'
+    Post.objects.filter(pk=instance.pk).update(
+        image_variants=instance.image_variants,
+        image_status=instance.image_status
+    )
+    if not instance.image:
+        return
+    enqueue_image_task(instance)
+    if settings.IMAGE_TASKS_EAGER:
+        run_task(instance.image_task)
+        instance.refresh_from_db(fields=('image_variants', 'image_status'))
+
+
+@receiver(post_delete, sender=Post)
+def release_post_image(sender, instance, **kwargs):
+    if in_bulk_changes():
+        return
+    release_image(instance.image.storage, instance.image.name,
+                  instance.image_variants)
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    index_posts([instance], connections[instance._state.db])
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    if in_bulk_changes():
+        return
+    remove_posts([instance.pk], connections[instance._state.db])
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(sender, instance, **kwargs):
+    if in_bulk_changes():
+        return
+    invalidate_post_cards([instance.pk])
+    reset_next_visibility_change()
+    invalidate_category_pages([
+        getattr(instance, '_previous_category_id', None),
+        instance.category_id,
+    ])
+
+
+@receiver(pre_save, sender=Category)
+def remember_category_slug(sender, instance, **kwargs):
+    instance._previous_slug = Category.objects.filter(
+        pk=instance.pk
+    ).values_list('slug', flat=True).first()
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def invalidate_category(sender, instance, **kwargs):
+    invalidate_related_post_cards(instance)
+    reset_next_visibility_change()
+    scopes = {INDEX_SCOPE, category_scope(instance.slug)}
+    previous_slug = getattr(instance, '_previous_slug', None)
+    if previous_slug:
+        scopes.add(category_scope(previous_slug))
+    invalidate_pages(*scopes)
+
+
+@receiver(post_save, sender=Location)
+@receiver(pre_delete, sender=Location)
+def invalidate_location(sender, instance, **kwargs):
+    invalidate_related_post_cards(instance)
+    invalidate_pages(FEEDS_SCOPE)
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_post_cards(sender, instance, created,
+                                 update_fields=None, **kwargs):
+    if created or (update_fields and 'username' not in update_fields):
+        return
+    invalidate_related_post_cards(instance)
+    invalidate_pages(FEEDS_SCOPE)
+
+
+def invalidate_related_post_cards(instance):
+    invalidate_post_cards(
+        instance.posts.values_list('pk', flat=True)
+    )
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -0,0 +1,104 @@
+from functools import lru_cache
+
+VOWELS = frozenset('аеиоуыэюя')
+
+PERFECTIVE_GERUND = (
+    ('в', 'вши', 'вшись'),
+    ('ив', 'ивши', 'ившись', 'ыв', 'ывши', 'ывшись'),
+)
+ADJECTIVE = ((), (
+    'ее', 'ие', 'ые', 'ое', 'ими', 'ыми', 'ей', 'ий', 'ый', 'ой', 'ем',
+    'им', 'ым', 'ом', 'его', 'ого', 'ему', 'ому', 'их', 'ых', 'ую', 'юю',
+    'ая', 'яя', 'ою', 'ею',
+))
+PARTICIPLE = (
+    ('ем', 'нн', 'вш', 'ющ', 'щ'),
+    ('ивш', 'ывш', 'ующ'),
+)
+REFLEXIVE = ((), ('ся', 'сь'))
+VERB = (
+    ('ла', 'на', 'ете', 'йте', 'ли', 'й', 'л', 'ем', 'н', 'ло', 'но', 'ет',
+     'ют', 'ны', 'ть', 'ешь', 'нно'),
+    ('ила', 'ыла', 'ена', 'ейте', 'уйте', 'ите', 'или', 'ыли', 'ей', 'уй',
+     'ил', 'ыл', 'им', 'ым', 'ен', 'ило', 'ыло', 'ено', 'ят', 'ует', 'уют',
+     'ит', 'ыт', 'ены', 'ить', 'ыть', 'ишь', 'ую', 'ю'),
+)
+NOUN = ((), (
+    'а', 'ев', 'ов', 'ие', 'ье', 'е', 'иями', 'ями', 'ами', 'еи', 'ии', 'и',
+    'ией', 'ей', 'ой', 'ий', 'й', 'иям', 'ям', 'ием', 'ем', 'ам', 'ом', 'о',
+    'у', 'ах', 'иях', 'ях', 'ы', 'ь', 'ию', 'ью', 'ю', 'ия', 'ья', 'я',
+))
+SUPERLATIVE = ((), ('ейше', 'ейш'))
+DERIVATIONAL = ((), ('ость', 'ост'))
+
+
+def _longest_first(groups):
+    return tuple(sorted(
+        ((ending, index == 0)
+         for index, endings in enumerate(groups) for ending in endings),
+        key=lambda item: -len(item[0])
+    ))
+
+
+PERFECTIVE_GERUND, ADJECTIVE, PARTICIPLE, REFLEXIVE, VERB, NOUN, \
+    SUPERLATIVE, DERIVATIONAL = map(_longest_first, (
+        PERFECTIVE_GERUND, ADJECTIVE, PARTICIPLE, REFLEXIVE, VERB, NOUN,
+        SUPERLATIVE, DERIVATIONAL,
+    ))
+
+
+def _regions(word):
+    positions = []
+    index, length = 0, len(word)
+    for _ in range(2):
+        while index < length and word[index] not in VOWELS:
+            index += 1
+        index += 1
+        positions.append(min(index, length))
+        while index < length and word[index] in VOWELS:
+            index += 1
+        index += 1
+    return positions[0], min(index, length)
+
+
+def _strip(word, endings, limit):
+    for ending, after_a in endings:
+        if not word.endswith(ending):
+            continue
+        start = len(word) - len(ending)
+        if start < limit:
+            return None
+        if after_a and (start - 1 < limit or word[start - 1] not in 'ая'):
+            return None
+        return word[:start]
+    return None
+
+
+@lru_cache(maxsize=65536)
+def stem(word):
+    word = word.replace('ё', 'е')
+    rv, r2 = _regions(word)
+    if rv >= len(word):
+        return word
+    stripped = _strip(word, PERFECTIVE_GERUND, rv)
+    if stripped is None:
+        word = _strip(word, REFLEXIVE, rv) or word
+        stripped = _strip(word, ADJECTIVE, rv)
+        if stripped is not None:
+            stripped = _strip(stripped, PARTICIPLE, rv) or stripped
+        else:
+            stripped = _strip(word, VERB, rv)
+            if stripped is None:
+                stripped = _strip(word, NOUN, rv)
+    word = word if stripped is None else stripped
+    if word.endswith('и') and len(word) - 1 >= rv:
+        word = word[:-1]
+    word = _strip(word, DERIVATIONAL, r2) or word
+    stripped = _strip(word, SUPERLATIVE, rv)
+    if stripped is not None:
+        word = stripped
+    if word.endswith('нн') and len(word) - 2 >= rv:
+        word = word[:-1]
+    elif word.endswith('ь') and len(word) - 1 >= rv:
+        word = word[:-1]
+    return word
@@ -0,0 +1,38 @@
+import hashlib
+import posixpath
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    def hashed_name(self, digest, name):
+        _, extension = posixpath.splitext(name)
+        return posixpath.join(
+            digest[:2], digest[2:4], f'{digest}{extension.lower()}'
+        )
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        name = self.hashed_name(digest.hexdigest(), name)
+        try:
+            return super().save(name, content, max_length)
+        except FileExistsError:
+            return name
+
+    def get_available_name(self, name, max_length=None):
+        if self.exists(name):
+            raise FileExistsError(name)
+        return name
+
+
+post_image_storage = ContentAddressedStorage()
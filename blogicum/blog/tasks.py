@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import invalidate_category_pages, invalidate_post_cards
+from .images import process_image, release_image
+from .models import ImageTask, Post
+from .storage import post_image_storage
+
+
+def enqueue_image_task(post):
+    ImageTask.objects.update_or_create(
+        post=post,
+        defaults={
+            'image': post.image.name,
+            'attempts': 0,
+            'run_after': timezone.now(),
+            'locked_at': None,
+            'error': '',
+        }
+    )
+
+
+def claim_tasks(limit):
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.IMAGE_TASK_LOCK_TIMEOUT)
+    claimed = []
+    candidates = ImageTask.objects.filter(
+        Q(locked_at__isnull=True) | Q(locked_at__lt=stale),
+        run_after__lte=now,
+    ).values_list('pk', 'locked_at')[:limit]
+    for pk, locked_at in candidates:
+        if ImageTask.objects.filter(
+            pk=pk, locked_at=locked_at
+        ).update(locked_at=now):
+            claimed.append(ImageTask.objects.get(pk=pk))
+    return claimed
+
+
+def complete_task(task, name, variants):
+    updated = Post.objects.filter(
+        pk=task.post_id, image=task.image
+    ).update(image=name, image_variants=variants, image_status='ready')
+    ImageTask.objects.filter(pk=task.pk, image=task.image).delete()
+    if updated:
+        invalidate_task_post(task)
+    if name != task.image:
+        release_image(post_image_storage, task.image, {})
+
+
+def fail_task(task, error):
+    attempts = task.attempts + 1
+    if attempts >= settings.IMAGE_TASK_MAX_ATTEMPTS:
+        Post.objects.filter(
+            pk=task.post_id, image=task.image
+        ).update(image_status='failed')
+        ImageTask.objects.filter(pk=task.pk, image=task.image).delete()
+        invalidate_task_post(task)
+        return
+    ImageTask.objects.filter(pk=task.pk, image=task.image).update(
+        attempts=attempts,
+        error=str(error),
+        locked_at=None,
+        run_after=timezone.now() + timedelta(
+            seconds=settings.IMAGE_TASK_RETRY_DELAY * 2 ** task.attempts
+        ),
+    )
+
+
+def invalidate_task_post(task):
+    invalidate_post_cards([task.post_id])
+    invalidate_category_pages(
+        Post.objects.filter(pk=task.post_id).values('category_id')
+    )
+
+
+def run_task(task):
+    try:
+        name, variants = process_image(task.image)
+    except (OSError, ValueError) as error:
+        fail_task(task, error)
+    else:
+        complete_task(task, name, variants)
@@ -0,0 +1,45 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from blog.images import FORMATS
+
+register = template.Library()
+
+
+def srcset(storage, variants):
+    return ', '.join(
+        f'{storage.url(name)} {width}w' for width, name in variants
+    )
+
+
+@register.simple_tag
+def responsive_image(post, sizes='100vw', css_class=''):
+    if post.image_status == 'pending':
+        return format_html(
+            '<img class="{}" src="{}" alt="Картинка обрабатывается">',
+            css_class,
+            static('img/image-processing.svg'),
+        )
+    storage = post.image.storage
+    variants = post.image_variants or {}
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (mime_type, srcset(storage, variants[image_format]), sizes)
+            for image_format, (_, mime_type) in FORMATS.items()
+            if image_format != 'jpeg' and variants.get(image_format)
+        )
+    )
+    fallback = variants.get('jpeg')
+    fallback_srcset = format_html(
+        ' srcset="{}" sizes="{}"', srcset(storage, fallback), sizes
+    ) if fallback else ''
+    return format_html(
+        '<picture>{}<img class="{}" src="{}"{} loading="lazy"></picture>',
+        sources,
+        css_class,
+        post.image.url,
+        fallback_srcset,
+    )
@@ -0,0 +1,11 @@
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+
+class LimitedTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    chunk_size = 64 * 2 ** 10
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > settings.MAX_IMAGE_UPLOAD_SIZE:
+            return None
+        return super().receive_data_chunk(raw_data, start)
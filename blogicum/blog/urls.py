@@ -2,13 +2,14 @@ from django.urls import path
 
 from .views import PostListView, PostDetailView, PostCreateView, \
     PostUpdateView, PostDeleteView, CommentCreateView, CommentUpdateView, \
-    CommentDeleteView, CategoryListView, ProfileListView, \
-    ProfileUpdateView
+    CommentDeleteView, CommentListView, CategoryListView, ProfileListView, \
+    ProfileUpdateView, SearchView
 
 app_name = 'blog'
 
 urlpatterns = [
     path('', PostListView.as_view(), name='index'),
+    path('search/', SearchView.as_view(), name='search'),
     path('posts/<int:post_id>/', PostDetailView.as_view(), name='post_detail'),
     path('posts/create/', PostCreateView.as_view(), name='create_post'),
     path('posts/<int:post_id>/edit/',
@@ -16,6 +17,8 @@ urlpatterns = [
     path('posts/<int:post_id>/delete/',
          PostDeleteView.as_view(), name='delete_post'),
 
+    path('posts/<int:post_id>/comments/',
+         CommentListView.as_view(), name='comments'),
     path('posts/<int:post_id>/comment/',
          CommentCreateView.as_view(), name='add_comment'),
     path('posts/<int:post_id>/edit_comment/<int:comment_id>/',
@@ -1,29 +1,52 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import Count
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
-from django.conf import settings
 from django.utils import timezone
+from django.utils.http import urlencode
 from django.views.generic import (
     CreateView, UpdateView, DeleteView, ListView, DetailView
 )
 from django.urls import reverse_lazy, reverse
 
 from .forms import CommentForm, ProfileForm
-from .mixins import CommentMixin, PostMixin
+from .mixins import CommentMixin, CursorPaginationMixin, PostMixin
 from .models import Post, Category, User, Comment
+from .paginators import CursorPaginator
+from .search import search_posts
+
+
+def get_visible_post_or_404(user, post_id):
+    post = get_object_or_404(Post.objects.with_related(), pk=post_id)
+    if not post.is_visible_to(user):
+        raise Http404
+    return post
 
 
-class PostListView(ListView):
+class PostListView(CursorPaginationMixin, ListView):
     model = Post
     template_name = 'blog/index.html'
-    paginate_by = settings.POSTS_BY_PAGE
     pk_url_kwarg = 'post_id'
 
     def get_queryset(self):
         return Post.objects.published()
 
 
+class SearchView(ListView):
+    template_name = 'blog/search.html'
+    paginate_by = settings.POSTS_BY_PAGE
+
+    def get_queryset(self):
+        self.query = self.request.GET.get('q', '').strip()
+        return search_posts(Post.objects.published(), self.query)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.query
+        context['page_query'] = urlencode({'q': self.query}) + '&'
+        return context
+
+
 class PostDetailView(LoginRequiredMixin, DetailView):
     model = Post
     template_name = 'blog/detail.html'
@@ -32,14 +55,37 @@ class PostDetailView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        context['comments'] = context['comments_page'] = CursorPaginator(
+            self.object.comments.select_related('author'),
+            settings.COMMENTS_FIRST_PAGE,
+            field='created_at',
+            descending=False
+        ).page()
         return context
 
     def get_object(self, queryset=None):
-        published_posts = Post.objects.published()
-        user_posts = Post.objects.filter(author=self.request.user)
-        posts = published_posts | user_posts
-        return get_object_or_404(posts, pk=self.kwargs['post_id'])
+        return get_visible_post_or_404(self.request.user,
+                                       self.kwargs['post_id'])
+
+
+class CommentListView(LoginRequiredMixin, CursorPaginationMixin, ListView):
+    template_name = 'includes/comment_list.html'
+    context_object_name = 'comments'
+    paginate_by = settings.COMMENTS_BY_PAGE
+    cursor_pagination = True
+    cursor_field = 'created_at'
+    cursor_descending = False
+
+    def get_queryset(self):
+        self.post = get_visible_post_or_404(self.request.user,
+                                            self.kwargs['post_id'])
+        return self.post.comments.select_related('author')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['post'] = self.post
+        context['comments_page'] = context['page_obj']
+        return context
 
 
 class PostCreateView(PostMixin, LoginRequiredMixin, CreateView):
@@ -78,59 +124,44 @@ class PostDeleteView(PostMixin, UserPassesTestMixin, DeleteView):
         )
 
 
-class CategoryListView(ListView):
+class CategoryListView(CursorPaginationMixin, ListView):
     model = Post
     template_name = 'blog/category.html'
     context_object_name = 'posts'
-    paginate_by = settings.POSTS_BY_PAGE
     slug_url_kwarg = 'category_slug'
 
     def get_queryset(self):
-        category = get_object_or_404(
-            Category, slug=self.kwargs[self.slug_url_kwarg])
-        return Post.objects.filter(
-            category=category,
-            is_published=True,
-            pub_date__lte=timezone.now()
-        ).order_by('-pub_date')
+        self.category = get_object_or_404(
+            Category,
+            slug=self.kwargs[self.slug_url_kwarg],
+            is_published=True
+        )
+        return Post.objects.published().filter(category=self.category)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        category = get_object_or_404(
-            Category, slug=self.kwargs[self.slug_url_kwarg])
-        if not category.is_published:
-            raise Http404
-        context['category'] = category
+        context['category'] = self.category
         return context
 
 
-class ProfileListView(ListView):
+class ProfileListView(CursorPaginationMixin, ListView):
     model = Post
     template_name = 'blog/profile.html'
-    paginate_by = settings.POSTS_BY_PAGE
+
+    def get_queryset(self):
+        self.profile = get_object_or_404(
+            User, username=self.kwargs['username'])
+        queryset = Post.objects.filter(author=self.profile).with_related()
+        if self.request.user != self.profile:
+            queryset = queryset.filter(pub_date__lte=timezone.now())
+        return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = get_object_or_404(
-            User,
-            username=self.kwargs['username']
-        )
+        context['profile'] = self.profile
+        context['profile_summary'] = self.object_list.summary()
         return context
 
-    def get_queryset(self):
-        user_profile = get_object_or_404(
-            User, username=self.kwargs['username'])
-        queryset = Post.objects.filter(author=user_profile)
-
-        if self.request.user == user_profile:
-            return queryset.annotate(
-                comment_count=Count('comments')).order_by('-pub_date')
-        else:
-            today = timezone.now()
-            return queryset.filter(
-                pub_date__lte=today
-            ).annotate(comment_count=Count('comments')).order_by('-pub_date')
-
 
 class ProfileUpdateView(LoginRequiredMixin, UpdateView):
     model = User
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from django.template import engines
+
+
+def template_names(engine):
+    names = set()
+    for directory in engine.engine.dirs:
+        root = Path(directory)
+        names.update(
+            path.relative_to(root).as_posix()
+            for path in root.rglob('*.html')
+            if path.is_file()
+        )
+    return sorted(names)
+
+
+def warm_templates(using='django'):
+    engine = engines[using]
+    names = template_names(engine)
+    for name in names:
+        engine.get_template(name)
+    return names
@@ -0,0 +1,15 @@
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+ENVIRONMENT = os.getenv('BLOGICUM_ENV', 'dev')
+
+if ENVIRONMENT == 'dev':
+    from .dev import *  # noqa: F401,F403
+elif ENVIRONMENT == 'prod':
+    from .prod import *  # noqa: F401,F403
+else:
+    raise ImproperlyConfigured(
+        f'Неизвестное окружение BLOGICUM_ENV={ENVIRONMENT!r}: '
+        'ожидается dev или prod.'
+    )
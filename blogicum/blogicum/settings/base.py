@@ -0,0 +1,187 @@
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+BLOGICUM_ENV = 'base'
+
+SECRET_KEY = os.getenv('DJANGO_SECRET_KEY', '')
+
+DEBUG = False
+
+ALLOWED_HOSTS = []
+
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'django_bootstrap5',
+
+    'blog.apps.BlogConfig',
+    'pages.apps.PagesConfig',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'blog.middleware.ReplicaRoutingMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'blog.middleware.AnonymousPageCacheMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'blogicum.urls'
+
+TEMPLATES_DIR = BASE_DIR / 'templates'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [TEMPLATES_DIR],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+                'blog.context_processors.cache_timeouts',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'blogicum.wsgi.application'
+
+WARM_TEMPLATES = False
+
+
+DATABASE_ENGINE = os.getenv('BLOGICUM_DATABASE', 'sqlite')
+
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'blog.backends.postgresql_pool',
+            'NAME': os.getenv('POSTGRES_DB', 'blogicum'),
+            'USER': os.getenv('POSTGRES_USER', 'blogicum'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+            'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+            'PORT': os.getenv('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+            'DISABLE_SERVER_SIDE_CURSORS': (
+                os.getenv('POSTGRES_DISABLE_SERVER_SIDE_CURSORS') == '1'
+            ),
+            'POOL': {
+                'MIN_SIZE': int(os.getenv('POSTGRES_POOL_MIN_SIZE', '1')),
+                'MAX_SIZE': int(os.getenv('POSTGRES_POOL_MAX_SIZE', '20')),
+                'TIMEOUT': float(os.getenv('POSTGRES_POOL_TIMEOUT', '30')),
+            },
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+        }
+    }
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20_000,
+    'cache_size': -64 * 2 ** 10,
+    'mmap_size': 256 * 2 ** 20,
+    'temp_store': 'MEMORY',
+}
+
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ['blog.routers.ReplicaRouter']
+REPLICA_PIN_SECONDS = 10
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': ('django.contrib.auth.password_validation.'
+                 'UserAttributeSimilarityValidator'),
+    },
+    {
+        'NAME': ('django.contrib.auth.password_validation.'
+                 'MinimumLengthValidator'),
+    },
+    {
+        'NAME': ('django.contrib.auth.password_validation.'
+                 'CommonPasswordValidator'),
+    },
+    {
+        'NAME': ('django.contrib.auth.password_validation.'
+                 'NumericPasswordValidator'),
+    },
+]
+
+
+LANGUAGE_CODE = 'ru-RU'
+
+TIME_ZONE = 'Europe/Moscow'
+
+USE_I18N = True
+
+USE_L10N = True
+
+USE_TZ = True
+
+STATIC_URL = '/static/'
+STATICFILES_DIRS = [BASE_DIR / 'static']
+
+MEDIA_ROOT = BASE_DIR / 'media/'
+MEDIA_URL = 'media/'
+MEDIA_SERVE = True
+MEDIA_MAX_AGE = 60 * 60
+MEDIA_SENDFILE_HEADER = None
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+
+FILE_UPLOAD_HANDLERS = ['blog.uploads.LimitedTemporaryFileUploadHandler']
+MAX_IMAGE_UPLOAD_SIZE = 10 * 2 ** 20
+MAX_IMAGE_PIXELS = 40_000_000
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+MAX_FIELD_LENGTH = 256
+REPRESENTATION_LENGTH = 20
+POSTS_BY_PAGE = 10
+CURSOR_PAGINATION = False
+COMMENTS_FIRST_PAGE = 50
+COMMENTS_BY_PAGE = 50
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_TASKS_EAGER = False
+IMAGE_TASK_WORKERS = 2
+IMAGE_TASK_MAX_ATTEMPTS = 5
+IMAGE_TASK_RETRY_DELAY = 30
+IMAGE_TASK_LOCK_TIMEOUT = 10 * 60
+POST_CARD_CACHE_TIMEOUT = 60 * 60
+PAGE_CACHE_TIMEOUT = 60 * 5
+PAGE_MAX_AGE = 60
+
+CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
+
+LOGIN_REDIRECT_URL = 'blog:index'
+LOGIN_URL = 'login'
+
+EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
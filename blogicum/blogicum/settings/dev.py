@@ -0,0 +1,11 @@
+from .base import *  # noqa: F401,F403
+
+BLOGICUM_ENV = 'dev'
+
+SECRET_KEY = (
+    'django-insecure-dsnvjjc4*!dbg^5$r1bi2@f7g7+1913g81f0$t3!1%92o+9_)3'
+)
+
+DEBUG = True
+
+INTERNAL_IPS = ['127.0.0.1']
@@ -1,10 +1,11 @@
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.auth.forms import UserCreationForm
-from django.urls import path, include, reverse_lazy
+from django.urls import path, re_path, include, reverse_lazy
 from django.views.generic import CreateView
 
+from blog.media import serve_media
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('django.contrib.auth.urls')),
@@ -21,10 +22,14 @@ urlpatterns = [
     path('pages/', include('pages.urls', namespace='pages')),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(
-        settings.MEDIA_URL, document_root=settings.MEDIA_ROOT
-    )
+if settings.MEDIA_SERVE:
+    urlpatterns += [
+        re_path(
+            rf'^{settings.MEDIA_URL.lstrip("/")}(?P<path>.+)$',
+            serve_media,
+            name='media'
+        ),
+    ]
 
 handler404 = 'pages.views.page_not_found'
 handler403 = 'pages.views.csrf_failure'
@@ -21,6 +21,34 @@ from conftest import (
 )
 
 
+@pytest.fixture
+def make_published_posts(mixer: Mixer, user, published_category):
+    def make(count, **fields):
+        fields = {
+            "author": user,
+            "category": published_category,
+            "is_published": True,
+            "pub_date": timezone.now() - timedelta(days=1),
+            "image": "",
+            **fields,
+        }
+        return mixer.cycle(count).blend("blog.Post", **fields)
+    return make
+
+
+@pytest.fixture
+def make_published_post(make_published_posts):
+    def make(**fields):
+        post, = make_published_posts(1, **fields)
+        return post
+    return make
+
+
+@pytest.fixture
+def published_post(make_published_post, published_location):
+    return make_published_post(location=published_location)
+
+
 @pytest.fixture
 def posts_with_unpublished_category(mixer: Mixer, user: Model):
     return mixer.cycle(N_PER_FIXTURE).blend(
@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog import paginators
+from blog.models import Post
+from blog.paginators import EstimatedCountPaginator, estimate_count
+
+pytestmark = [pytest.mark.django_db]
+
+CHANGELIST_URL = '/admin/blog/post/'
+
+
+@pytest.fixture
+def make_posts(mixer, make_published_posts, published_location):
+    def make(count):
+        authors = mixer.cycle(count).blend('auth.User')
+        return make_published_posts(
+            count,
+            author=(author for author in authors),
+            location=published_location,
+            text='слово ' * 500,
+        )
+    return make
+
+
+def changelist_queries(admin_client):
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(CHANGELIST_URL)
+    assert response.status_code == 200
+    return len(queries)
+
+
+def test_changelist_query_count_is_constant(admin_client, make_posts):
+    make_posts(2)
+    few = changelist_queries(admin_client)
+    make_posts(20)
+    many = changelist_queries(admin_client)
+    assert few == many, (
+        'Убедитесь, что число запросов списка публикаций в админке '
+        'не зависит от количества строк на странице.'
+    )
+    assert many <= 8
+
+
+def test_changelist_truncates_text(admin_client, make_posts):
+    make_posts(1)
+    content = admin_client.get(CHANGELIST_URL).content.decode()
+    assert 'слово ' * 30 not in content, (
+        'Убедитесь, что в списке публикаций выводится сокращённый текст.'
+    )
+
+
+def test_changelist_uses_raw_id_widgets(admin_client, make_posts):
+    post, = make_posts(1)
+    content = admin_client.get(CHANGELIST_URL).content.decode()
+    assert 'vForeignKeyRawIdAdminField' in content
+    assert f'/admin/blog/category/{post.category.pk}/change/' in content
+
+
+def test_estimated_count_paginator(monkeypatch, make_posts):
+    make_posts(3)
+    monkeypatch.setattr(paginators, 'estimate_count', lambda queryset: 10**6)
+    assert EstimatedCountPaginator(Post.objects.all(), 10).count == 10**6
+    assert EstimatedCountPaginator(
+        Post.objects.filter(is_published=True), 10
+    ).count == 3
+
+
+def test_estimate_count_reads_table_statistics(make_posts):
+    make_posts(3)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    assert estimate_count(Post.objects.all()) == 3
@@ -0,0 +1,202 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from django.db import OperationalError, connections, transaction
+from django.utils import timezone
+
+from blog.models import Category, Location, Post, User
+from blog.paginators import CursorPaginator
+from blog.search import get_backend, search_posts
+
+POSTGRESQL_ALIAS = 'postgresql'
+
+
+def postgresql_settings():
+    return {
+        'ENGINE': 'blog.backends.postgresql_pool',
+        'NAME': os.getenv('POSTGRES_DB', 'blogicum'),
+        'USER': os.getenv('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+        'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        'POOL': {'MIN_SIZE': 1, 'MAX_SIZE': 4},
+    }
+
+
+@pytest.fixture(scope='module')
+def postgresql(django_db_blocker):
+    psycopg2 = pytest.importorskip('psycopg2')
+    params = postgresql_settings()
+    try:
+        psycopg2.connect(
+            dbname='postgres', user=params['USER'],
+            password=params['PASSWORD'], host=params['HOST'],
+            port=params['PORT'], connect_timeout=2,
+        ).close()
+    except psycopg2.OperationalError:
+        pytest.skip('Локальный PostgreSQL недоступен.')
+    connections.databases[POSTGRESQL_ALIAS] = params
+    creation = connections[POSTGRESQL_ALIAS].creation
+    with django_db_blocker.unblock():
+        old_name = creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+    yield POSTGRESQL_ALIAS
+    connections[POSTGRESQL_ALIAS].close_pool()
+    with django_db_blocker.unblock():
+        creation.destroy_test_db(old_name, verbosity=0)
+    del connections[POSTGRESQL_ALIAS]
+    del connections.databases[POSTGRESQL_ALIAS]
+
+
+@pytest.fixture(params=('default', POSTGRESQL_ALIAS))
+def alias(request, django_db_blocker):
+    if request.param == 'default':
+        request.getfixturevalue('db')
+        yield 'default'
+        return
+    alias = request.getfixturevalue('postgresql')
+    with django_db_blocker.unblock():
+        with transaction.atomic(using=alias):
+            yield alias
+            transaction.set_rollback(True, using=alias)
+
+
+@pytest.fixture
+def feed(alias):
+    now = timezone.now()
+    users = User.objects.using(alias)
+    author = users.create(username='author')
+    other = users.create(username='other')
+    categories = Category.objects.using(alias)
+    visible = categories.create(title='Открытая', slug='open',
+                                description='-')
+    hidden = categories.create(title='Скрытая', slug='hidden',
+                               description='-', is_published=False)
+    location = Location.objects.using(alias).create(name='Город')
+    Post.objects.using(alias).bulk_create([
+        Post(title=f'Горы {index}', text='Поход в горы', author=author,
+             category=visible, location=location,
+             pub_date=now - timedelta(days=index))
+        for index in range(1, 6)
+    ] + [
+        Post(title='Черновик', text='горы', author=author,
+             category=visible, is_published=False,
+             pub_date=now - timedelta(days=6)),
+        Post(title='Будущее', text='горы', author=other,
+             category=visible, pub_date=now + timedelta(days=1)),
+        Post(title='В скрытой', text='горы', author=other,
+             category=hidden, pub_date=now - timedelta(days=1)),
+    ])
+    posts = list(Post.objects.using(alias).order_by('pk'))
+    return alias, author, visible, posts
+
+
+def test_published_feed(feed):
+    alias, _, _, posts = feed
+    assert [
+        post.pk for post in Post.objects.using(alias).published()
+    ] == [post.pk for post in posts[:5]], (
+        'Убедитесь, что лента опубликованных записей одинакова на всех '
+        'поддерживаемых базах данных.'
+    )
+
+
+def test_category_and_profile_feeds(feed):
+    alias, author, category, posts = feed
+    assert Post.objects.using(alias).published().filter(
+        category=category
+    ).count() == 5
+    profile = Post.objects.using(alias).with_related().filter(author=author)
+    assert [post.pk for post in profile] == [
+        post.pk for post in posts[:6]
+    ]
+    summary = profile.summary()
+    assert summary['post_total'] == 6
+    assert summary['comment_total'] == 0
+
+
+def test_cursor_pagination(feed):
+    alias, _, _, posts = feed
+    paginator = CursorPaginator(Post.objects.using(alias).published(), 2)
+    first = paginator.page()
+    second = paginator.page(first.next_cursor)
+    assert [post.pk for post in first.object_list + second.object_list] == [
+        post.pk for post in posts[:4]
+    ]
+
+
+def test_search(feed):
+    alias, _, _, posts = feed
+    get_backend(connections[alias]).index(posts)
+    found = search_posts(Post.objects.using(alias).published(), 'гора')
+    assert {post.pk for post in found} == {post.pk for post in posts[:5]}
+
+
+def test_server_side_cursor_iteration(feed):
+    alias, _, _, posts = feed
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        pytest.skip('Курсоры на стороне сервера есть только в PostgreSQL.')
+    iterator = Post.objects.using(alias).iterator(chunk_size=2)
+    next(iterator)
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT count(*) FROM pg_cursors')
+        assert cursor.fetchone()[0] >= 1, (
+            'Убедитесь, что iterator() читает через курсор на сервере.'
+        )
+    assert len(list(iterator)) == len(posts) - 1
+
+
+def test_connection_pool_reuses_connections(postgresql, django_db_blocker):
+    connection = connections[postgresql]
+    with django_db_blocker.unblock():
+        connection.ensure_connection()
+        raw = connection.connection
+        connection.close()
+        connection.ensure_connection()
+        assert connection.connection is raw, (
+            'Убедитесь, что закрытое соединение возвращается в пул.'
+        )
+        connection.close()
+
+
+def test_connection_pool_follows_database_name(postgresql, django_db_blocker):
+    connection = connections[postgresql]
+    with django_db_blocker.unblock():
+        connection.ensure_connection()
+        assert connection.connection.info.dbname == (
+            connection.settings_dict['NAME']
+        ), 'Убедитесь, что пул соединений подключается к тестовой базе.'
+        connection.close()
+
+
+def test_connection_pool_waits_for_free_connection(postgresql,
+                                                   django_db_blocker):
+    alias = f'{postgresql}_limited'
+    connections.databases[alias] = dict(
+        connections[postgresql].settings_dict,
+        POOL={'MIN_SIZE': 1, 'MAX_SIZE': 1, 'TIMEOUT': 0.5},
+    )
+
+    def connect():
+        try:
+            connections[alias].ensure_connection()
+        finally:
+            connections[alias].close()
+
+    holder = connections[alias]
+    try:
+        with django_db_blocker.unblock(), ThreadPoolExecutor(1) as executor:
+            holder.ensure_connection()
+            with pytest.raises(OperationalError):
+                executor.submit(connect).result()
+            waiting = executor.submit(connect)
+            holder.close()
+            waiting.result()
+    finally:
+        holder.close_pool()
+        del connections[alias]
+        del connections.databases[alias]
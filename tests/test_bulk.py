@@ -0,0 +1,102 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.bulk import delete_posts, unpublish_posts
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+CHANGELIST_URL = '/admin/blog/post/'
+
+
+def run_action(admin_client, action, posts, **data):
+    return admin_client.post(CHANGELIST_URL, {
+        'action': action,
+        '_selected_action': [post.pk for post in posts],
+        **data,
+    })
+
+
+def test_bulk_update_query_count_is_constant(make_published_posts):
+    make_published_posts(3)
+    with CaptureQueriesContext(connection) as few:
+        unpublish_posts(Post.objects.filter(is_published=True))
+    make_published_posts(30)
+    with CaptureQueriesContext(connection) as many:
+        unpublish_posts(Post.objects.filter(is_published=True))
+    assert len(few) == len(many), (
+        'Убедитесь, что массовое снятие с публикации выполняется '
+        'фиксированным числом запросов.'
+    )
+    assert not Post.objects.filter(is_published=True).exists()
+
+
+def test_admin_publish_actions(admin_client, make_published_posts):
+    posts = make_published_posts(3, is_published=False)
+    run_action(admin_client, 'publish', posts[:2])
+    assert set(Post.objects.filter(
+        is_published=True
+    ).values_list('pk', flat=True)) == {posts[0].pk, posts[1].pk}
+    run_action(admin_client, 'unpublish', posts)
+    assert not Post.objects.filter(is_published=True).exists()
+
+
+def test_admin_move_to_category(admin_client, make_published_posts,
+                                another_category):
+    posts = make_published_posts(2)
+    run_action(admin_client, 'move_to_category', posts,
+               category=another_category.pk)
+    assert set(Post.objects.values_list(
+        'category', flat=True
+    )) == {another_category.pk}
+
+
+def test_unpublish_invalidates_cached_feed(client, make_published_posts):
+    post, = make_published_posts(1)
+    assert post.title in client.get('/').content.decode()
+    unpublish_posts(Post.objects.filter(pk=post.pk))
+    assert post.title not in client.get('/').content.decode(), (
+        'Убедитесь, что массовые действия сбрасывают кеш лент.'
+    )
+
+
+def test_bulk_delete_cleans_up(client, make_published_posts, mixer, user):
+    posts = make_published_posts(3, title='Горы')
+    mixer.cycle(4).blend('blog.Comment', post=posts[0], author=user)
+    assert client.get('/search/', {'q': 'горы'}).context['page_obj']
+    delete_posts(Post.objects.filter(pk__in=[posts[0].pk, posts[1].pk]))
+    assert list(Post.objects.all()) == [posts[2]]
+    assert not Comment.objects.exists()
+    found = client.get('/search/', {'q': 'горы'}).context['page_obj']
+    assert list(found) == [posts[2]]
+
+
+def test_admin_delete_uses_bulk_delete(admin_client, make_published_posts):
+    posts = make_published_posts(2)
+    run_action(admin_client, 'delete_selected', posts, post='yes')
+    assert not Post.objects.exists()
+
+
+def test_bulk_posts_command(make_published_posts, user, another_category):
+    posts = make_published_posts(2, title='Горы')
+    out = StringIO()
+    call_command('bulk_posts', 'unpublish', '--author', user.username,
+                 stdout=out)
+    assert not Post.objects.filter(is_published=True).exists()
+    call_command('bulk_posts', 'move', '--ids', str(posts[0].pk),
+                 '--to-category', another_category.slug, stdout=out)
+    assert Post.objects.get(pk=posts[0].pk).category == another_category
+    call_command('bulk_posts', 'delete', '--search', 'горы', '--dry-run',
+                 stdout=out)
+    assert Post.objects.count() == 2
+    call_command('bulk_posts', 'delete', '--search', 'горы', stdout=out)
+    assert not Post.objects.exists()
+
+
+def test_bulk_posts_command_requires_filter():
+    with pytest.raises(CommandError):
+        call_command('bulk_posts', 'delete')
@@ -0,0 +1,110 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+CHANGELIST_URL = '/admin/blog/comment/'
+
+
+@pytest.fixture
+def posts(make_published_posts):
+    return make_published_posts(2)
+
+
+@pytest.fixture
+def make_comments(mixer, posts):
+    def make(count, post=None):
+        authors = mixer.cycle(count).blend('auth.User')
+        return mixer.cycle(count).blend(
+            'blog.Comment',
+            post=post or posts[0],
+            author=(author for author in authors),
+        )
+    return make
+
+
+def changelist_queries(admin_client, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(CHANGELIST_URL, params)
+    assert response.status_code == 200
+    return len(queries)
+
+
+def test_changelist_query_count_is_constant(admin_client, make_comments):
+    make_comments(2)
+    few = changelist_queries(admin_client)
+    make_comments(20)
+    many = changelist_queries(admin_client)
+    assert few == many, (
+        'Убедитесь, что список комментариев в админке загружает авторов '
+        'и публикации без дополнительных запросов на строку.'
+    )
+
+
+def test_filters_do_not_enumerate_users(admin_client, make_comments,
+                                        posts, mixer):
+    comments = make_comments(3)
+    extra_users = mixer.cycle(5).blend('auth.User')
+    author = comments[0].author
+    response = admin_client.get(CHANGELIST_URL, {'author': author.pk})
+    content = response.content.decode()
+    assert list(response.context['cl'].result_list) == [comments[0]]
+    assert all(user.username not in content for user in extra_users), (
+        'Убедитесь, что фильтр по автору не перечисляет всех пользователей.'
+    )
+    response = admin_client.get(CHANGELIST_URL, {'post': posts[1].pk})
+    assert not response.context['cl'].result_list
+
+
+def test_date_hierarchy(admin_client, make_comments):
+    comment, = make_comments(1)
+    response = admin_client.get(
+        CHANGELIST_URL, {'created_at__year': comment.created_at.year}
+    )
+    assert list(response.context['cl'].result_list) == [comment]
+
+
+def test_bulk_delete_updates_comment_count(admin_client, make_comments,
+                                           posts):
+    first = make_comments(3, post=posts[0])
+    second = make_comments(2, post=posts[1])
+    selected = [first[0], first[1], second[0]]
+    with CaptureQueriesContext(connection) as queries:
+        admin_client.post(CHANGELIST_URL, {
+            'action': 'delete_selected',
+            '_selected_action': [comment.pk for comment in selected],
+            'post': 'yes',
+        })
+    assert Comment.objects.count() == 2
+    assert dict(Post.objects.values_list('pk', 'comment_count')) == {
+        posts[0].pk: 1, posts[1].pk: 1,
+    }
+    counter_updates = [
+        query for query in queries.captured_queries
+        if query['sql'].startswith('UPDATE "blog_post"')
+    ]
+    assert len(counter_updates) == 1, (
+        'Убедитесь, что счётчики комментариев обновляются одним запросом.'
+    )
+
+
+@pytest.mark.parametrize('term', ('публ', 'Публикаци', 'нов публ'))
+def test_post_autocomplete_matches_prefixes(admin_client, posts, term):
+    posts[0].title = 'Новая публикация'
+    posts[0].save()
+    response = admin_client.get('/admin/autocomplete/', {
+        'app_label': 'blog',
+        'model_name': 'comment',
+        'field_name': 'post',
+        'term': term,
+    })
+    assert response.status_code == 200
+    assert [
+        result['id'] for result in response.json()['results']
+    ] == [str(posts[0].pk)], (
+        'Убедитесь, что автодополнение публикаций находит их по началу '
+        'слова.'
+    )
@@ -0,0 +1,83 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def stored_count(post):
+    return Post.objects.get(pk=post.pk).comment_count
+
+
+def test_counter_follows_comment_changes(mixer, make_published_post, user):
+    post = make_published_post()
+    comments = mixer.cycle(3).blend('blog.Comment', post=post, author=user)
+    assert stored_count(post) == 3, (
+        'Убедитесь, что при создании комментария счётчик публикации '
+        'увеличивается.'
+    )
+    comments[0].text = 'Исправленный текст'
+    comments[0].save()
+    assert stored_count(post) == 3
+    comments[1].delete()
+    assert stored_count(post) == 2, (
+        'Убедитесь, что при удалении комментария счётчик публикации '
+        'уменьшается.'
+    )
+
+
+def test_counter_survives_cascade_delete(mixer, make_published_posts, user,
+                                         another_user):
+    post, other_post = make_published_posts(2)
+    mixer.cycle(2).blend('blog.Comment', post=post, author=user)
+    mixer.blend('blog.Comment', post=other_post, author=user)
+    mixer.cycle(2).blend('blog.Comment', post=other_post, author=another_user)
+    post.delete()
+    assert stored_count(other_post) == 3, (
+        'Убедитесь, что каскадное удаление публикации не меняет счётчики '
+        'других публикаций.'
+    )
+    another_user.delete()
+    assert stored_count(other_post) == 1, (
+        'Убедитесь, что каскадное удаление комментариев вместе с автором '
+        'уменьшает счётчик публикации.'
+    )
+
+
+def test_recount_dry_run_reports_drift(mixer, make_published_posts, user):
+    post, accurate = make_published_posts(2)
+    mixer.cycle(2).blend('blog.Comment', post=post, author=user)
+    Post.objects.filter(pk=post.pk).update(comment_count=5)
+    out = StringIO()
+    call_command('recount_comments', dry_run=True, stdout=out)
+    assert out.getvalue().splitlines() == [f'{post.pk}: 5 -> 2'], (
+        'Убедитесь, что `recount_comments --dry-run` выводит публикации '
+        'с расхождениями.'
+    )
+    assert stored_count(post) == 5, (
+        'Убедитесь, что `recount_comments --dry-run` ничего не изменяет.'
+    )
+    assert stored_count(accurate) == 0
+
+
+def test_recount_repairs_drift(client, mixer, make_published_posts, user):
+    post, empty, accurate = make_published_posts(3)
+    mixer.cycle(2).blend('blog.Comment', post=post, author=user)
+    mixer.blend('blog.Comment', post=accurate, author=user)
+    Post.objects.filter(pk=post.pk).update(comment_count=7)
+    Post.objects.filter(pk=empty.pk).update(comment_count=4)
+    assert 'Комментарии (7)' in client.get('/').content.decode()
+    out = StringIO()
+    call_command('recount_comments', stdout=out)
+    assert 'Исправлено публикаций: 2' in out.getvalue()
+    assert [stored_count(item) for item in (post, empty, accurate)] == [
+        2, 0, 1
+    ], 'Убедитесь, что `recount_comments` исправляет счётчики комментариев.'
+    content = client.get('/').content.decode()
+    assert 'Комментарии (7)' not in content and 'Комментарии (2)' in content, (
+        'Убедитесь, что после пересчёта кеш карточек и страниц ленты '
+        'сбрасывается.'
+    )
@@ -0,0 +1,54 @@
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.views import CommentListView
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def commented_post(mixer, make_published_post):
+    post = make_published_post()
+    created_at = timezone.now()
+    comments = mixer.cycle(7).blend('blog.Comment', post=post)
+    for comment in comments:
+        comment.created_at = created_at
+        comment.save()
+    return post, [comment.id for comment in comments]
+
+
+@override_settings(COMMENTS_FIRST_PAGE=3)
+def test_comment_threads_are_paginated(
+        user_client, commented_post, monkeypatch
+):
+    monkeypatch.setattr(CommentListView, 'paginate_by', 2)
+    post, comment_ids = commented_post
+    response = user_client.get(f'/posts/{post.id}/')
+    page = response.context['comments']
+    seen = [comment.id for comment in page]
+    assert len(seen) == 3, (
+        'Убедитесь, что на странице публикации выводится только первая'
+        ' страница комментариев.'
+    )
+    while page.has_next():
+        response = user_client.get(
+            f'/posts/{post.id}/comments/', {'cursor': page.next_cursor}
+        )
+        assert response.status_code == 200
+        page = response.context['comments_page']
+        seen += [comment.id for comment in page]
+    assert seen == sorted(comment_ids), (
+        'Убедитесь, что подгрузка комментариев выдаёт все комментарии'
+        ' по порядку, без пропусков и повторов.'
+    )
+
+
+def test_comment_fragment_respects_post_visibility(
+        another_user_client, commented_post
+):
+    post, _ = commented_post
+    post.is_published = False
+    post.save()
+    response = another_user_client.get(f'/posts/{post.id}/comments/')
+    assert response.status_code == 404
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from blog.mixins import CursorPaginationMixin
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def cursor_pagination(monkeypatch):
+    monkeypatch.setattr(CursorPaginationMixin, 'cursor_pagination', True)
+
+
+@pytest.fixture
+def feed_posts(make_published_posts):
+    now = timezone.now()
+    pub_dates = (
+        now - timedelta(hours=index // 3)
+        for index in range(N_PER_PAGE * 2 + 5)
+    )
+    return make_published_posts(N_PER_PAGE * 2 + 5, pub_date=pub_dates)
+
+
+def walk_feed(client, url):
+    pages = []
+    response = client.get(url)
+    while True:
+        page = response.context['page_obj']
+        pages.append([post.id for post in page])
+        if not page.has_next():
+            return pages, response
+        response = client.get(url, {'cursor': page.next_cursor})
+
+
+@pytest.mark.usefixtures('cursor_pagination')
+def test_cursor_pagination_walks_whole_feed(
+        user_client, feed_posts, published_category
+):
+    expected = [
+        post.id for post in sorted(
+            feed_posts, key=lambda post: (post.pub_date, post.id),
+            reverse=True
+        )
+    ]
+    for url in (
+        '/',
+        f'/category/{published_category.slug}/',
+        f'/profile/{feed_posts[0].author.username}/',
+    ):
+        pages, last_response = walk_feed(user_client, url)
+        assert [len(page) for page in pages] == [N_PER_PAGE, N_PER_PAGE, 5], (
+            f'Убедитесь, что страница `{url}` в режиме курсорной пагинации'
+            f' выдаёт по {N_PER_PAGE} публикаций на страницу.'
+        )
+        assert sum(pages, []) == expected, (
+            f'Убедитесь, что курсорная пагинация на странице `{url}`'
+            ' обходит ленту без пропусков и повторов.'
+        )
+        previous = last_response.context['page_obj'].previous_cursor
+        response = user_client.get(url, {'cursor': previous})
+        assert [post.id for post in response.context['page_obj']] == (
+            pages[-2]
+        ), (
+            f'Убедитесь, что ссылка на предыдущую страницу `{url}`'
+            ' возвращает предыдущую страницу ленты.'
+        )
+
+
+@pytest.mark.usefixtures('cursor_pagination')
+def test_cursor_pagination_skips_count_query(
+        user_client, feed_posts, django_assert_max_num_queries
+):
+    first_page = user_client.get('/').context['page_obj']
+    with django_assert_max_num_queries(4) as captured:
+        user_client.get('/', {'cursor': first_page.next_cursor})
+    sql = ' '.join(query['sql'] for query in captured.captured_queries)
+    assert 'COUNT(' not in sql.upper() and 'OFFSET' not in sql.upper(), (
+        'Убедитесь, что курсорная пагинация не выполняет COUNT и OFFSET.'
+    )
+
+
+@pytest.mark.usefixtures('cursor_pagination')
+def test_invalid_cursor_returns_404(user_client, feed_posts):
+    assert user_client.get('/', {'cursor': 'garbage'}).status_code == 404
@@ -0,0 +1,77 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from blog.models import ImageTask
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def image_settings(settings, media_root):
+    settings.IMAGE_VARIANT_WIDTHS = (320,)
+    settings.IMAGE_TASKS_EAGER = False
+
+
+def make_post(make_published_post, content):
+    return make_published_post(
+        image=SimpleUploadedFile('photo.jpg', content)
+    )
+
+
+def jpeg_with_exif():
+    buffer = BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = 'Camera'
+    Image.new('RGB', (800, 600), 'blue').save(buffer, 'JPEG', exif=exif)
+    return buffer.getvalue()
+
+
+def test_image_processed_by_worker(
+        make_published_post, user_client, client
+):
+    post = make_post(make_published_post, jpeg_with_exif())
+    assert post.image_status == 'pending'
+    assert ImageTask.objects.filter(post=post).exists()
+    assert 'image-processing.svg' in user_client.get('/').content.decode(), (
+        'Убедитесь, что до обработки картинки в карточке выводится заглушка.'
+    )
+    assert client.get('/')['X-Cache'] == 'MISS'
+    call_command('process_image_tasks', '--once', '--workers', '1')
+    post.refresh_from_db()
+    assert post.image_status == 'ready'
+    assert [width for width, _ in post.image_variants['jpeg']] == [320]
+    assert not ImageTask.objects.exists()
+    with post.image.open() as original:
+        assert not Image.open(original).getexif(), (
+            'Убедитесь, что из оригинала картинки удаляются EXIF-данные.'
+        )
+    assert 'image-processing.svg' not in (
+        user_client.get('/').content.decode()
+    )
+    response = client.get('/')
+    assert response['X-Cache'] == 'MISS', (
+        'Убедитесь, что после обработки картинки кеш страниц ленты '
+        'сбрасывается.'
+    )
+    assert 'image-processing.svg' not in response.content.decode()
+
+
+def test_broken_image_is_retried_then_failed(
+        make_published_post, client, settings
+):
+    post = make_post(make_published_post, b'not an image')
+    assert client.get('/')['X-Cache'] == 'MISS'
+    settings.IMAGE_TASK_RETRY_DELAY = 0
+    settings.IMAGE_TASK_MAX_ATTEMPTS = 2
+    call_command('process_image_tasks', '--once', '--workers', '1')
+    post.refresh_from_db()
+    assert post.image_status == 'failed'
+    assert not ImageTask.objects.exists()
+    assert client.get('/')['X-Cache'] == 'MISS', (
+        'Убедитесь, что после неудачной обработки картинки кеш страниц '
+        'ленты сбрасывается.'
+    )
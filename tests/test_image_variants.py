@@ -0,0 +1,66 @@
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def image_settings(settings, media_root):
+    settings.IMAGE_VARIANT_WIDTHS = (320, 640)
+    settings.IMAGE_TASKS_EAGER = True
+
+
+def make_image(width=1000, height=600, color='red'):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'JPEG')
+    return SimpleUploadedFile(
+        'photo.jpg', buffer.getvalue(), content_type='image/jpeg'
+    )
+
+
+@pytest.fixture
+def post_with_image(make_published_post):
+    return make_published_post(image=make_image())
+
+
+def test_variants_generated_on_upload(user_client, post_with_image):
+    variants = post_with_image.image_variants
+    assert [width for width, _ in variants['webp']] == [320, 640]
+    assert [width for width, _ in variants['jpeg']] == [320, 640]
+    storage = post_with_image.image.storage
+    for _, name in variants['webp']:
+        with storage.open(name) as variant:
+            assert Image.open(variant).format == 'WEBP'
+    content = user_client.get('/').content.decode()
+    webp_url = storage.url(variants['webp'][0][1])
+    assert 'srcset=' in content and f'{webp_url} 320w' in content, (
+        'Убедитесь, что карточка публикации выводит уменьшенные копии'
+        ' картинки через `srcset`.'
+    )
+
+
+def test_variants_replaced_with_image(post_with_image):
+    storage = post_with_image.image.storage
+    old_names = [name for _, name in post_with_image.image_variants['jpeg']]
+    post_with_image.image = make_image(500, 300, 'blue')
+    post_with_image.save()
+    assert [
+        width for width, _ in post_with_image.image_variants['jpeg']
+    ] == [320]
+    assert not any(storage.exists(name) for name in old_names)
+
+
+def test_backfill_command(client, post_with_image):
+    type(post_with_image).objects.update(image_variants={})
+    assert 'srcset=' not in client.get('/').content.decode()
+    call_command('generate_image_variants', stdout=StringIO())
+    post_with_image.refresh_from_db()
+    assert len(post_with_image.image_variants['jpeg']) == 2
+    assert 'srcset=' in client.get('/').content.decode(), (
+        'Убедитесь, что после создания копий картинок кеш карточек и '
+        'страниц ленты сбрасывается.'
+    )
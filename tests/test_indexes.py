@@ -0,0 +1,51 @@
+import pytest
+from django.db import connection
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def explain(queryset):
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+    return queryset.explain()
+
+
+@pytest.mark.skipif(
+    connection.vendor not in ('sqlite', 'postgresql'),
+    reason='Планы запросов проверяются только для SQLite и PostgreSQL.'
+)
+@pytest.mark.parametrize(
+    'build_queryset, index_name',
+    (
+        (
+            lambda post: Post.objects.published()[:10],
+            'post_published_feed_idx',
+        ),
+        (
+            lambda post: Post.objects.published().filter(
+                category=post.category
+            )[:10],
+            'post_category_feed_idx',
+        ),
+        (
+            lambda post: Post.objects.filter(
+                author=post.author
+            ).order_by('-pub_date')[:10],
+            'post_author_feed_idx',
+        ),
+        (
+            lambda post: Comment.objects.filter(post=post),
+            'comment_post_created_idx',
+        ),
+    ),
+    ids=('index', 'category', 'profile', 'comments'),
+)
+def test_feed_queries_use_indexes(published_post, build_queryset, index_name):
+    plan = explain(build_queryset(published_post))
+    assert index_name in plan, (
+        f'Убедитесь, что запрос использует индекс `{index_name}`.'
+        f' План запроса:\n{plan}'
+    )
@@ -0,0 +1,91 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from blog.storage import post_image_storage
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def image_settings(settings, media_root):
+    settings.IMAGE_VARIANT_WIDTHS = (320,)
+    settings.IMAGE_TASKS_EAGER = True
+
+
+def image_bytes(color):
+    buffer = BytesIO()
+    Image.new('RGB', (640, 480), color).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def make_post(make_published_post):
+    def make(color):
+        return make_published_post(
+            image=SimpleUploadedFile('Photo.JPG', image_bytes(color))
+        )
+    return make
+
+
+def test_identical_uploads_are_deduplicated(make_post):
+    first = make_post('red')
+    second = make_post('red')
+    assert first.image.name == second.image.name
+    digest, extension = first.image.name.rsplit('/', 1)[1].split('.')
+    assert first.image.name.startswith(f'{digest[:2]}/{digest[2:4]}/')
+    assert extension == 'jpg'
+    first.delete()
+    assert post_image_storage.exists(second.image.name), (
+        'Убедитесь, что файл, используемый другой публикацией,'
+        ' не удаляется вместе с публикацией.'
+    )
+    second.delete()
+    assert not post_image_storage.exists(second.image.name)
+
+
+def test_concurrent_identical_saves_keep_hashed_name(
+        media_root, monkeypatch
+):
+    content = image_bytes('blue')
+    name = post_image_storage.save('first.jpg', ContentFile(content))
+    exists = post_image_storage.exists
+    checked = []
+
+    def racing_exists(path):
+        checked.append(path)
+        return len(checked) > 1 and exists(path)
+
+    monkeypatch.setattr(post_image_storage, 'exists', racing_exists)
+    assert post_image_storage.save(
+        'second.jpg', ContentFile(content)
+    ) == name, (
+        'Убедитесь, что одновременная загрузка одинаковых файлов '
+        'сохраняет имя по хешу содержимого.'
+    )
+    assert [
+        path.relative_to(media_root).as_posix()
+        for path in media_root.rglob('*') if path.is_file()
+    ] == [name]
+
+
+def test_replaced_image_is_released(make_post):
+    post = make_post('red')
+    old_name = post.image.name
+    post.image = SimpleUploadedFile('new.jpg', image_bytes('blue'))
+    post.save()
+    assert not post_image_storage.exists(old_name)
+
+
+def test_orphans_are_collected(make_post):
+    post = make_post('red')
+    orphan = post_image_storage.save('orphan.jpg', ContentFile(b'orphan'))
+    call_command('collect_orphan_media', '--grace', '0')
+    assert not post_image_storage.exists(orphan)
+    assert post_image_storage.exists(post.image.name)
+    for _, name in post.image_variants['jpeg']:
+        assert post_image_storage.exists(name)
@@ -0,0 +1,98 @@
+import pytest
+
+HASHED_NAME = 'ab/cd/' + 'ab' * 32 + '.jpg'
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture(autouse=True)
+def media_files(settings, media_root):
+    settings.MEDIA_SENDFILE_HEADER = None
+    (media_root / 'ab' / 'cd').mkdir(parents=True)
+    (media_root / HASHED_NAME).write_bytes(CONTENT)
+    (media_root / 'plain.jpg').write_bytes(CONTENT)
+
+
+def get(client, name, **headers):
+    response = client.get(f'/media/{name}', **headers)
+    if response.streaming:
+        content = b''.join(response.streaming_content)
+    else:
+        content = response.content
+    return response, content
+
+
+def test_full_response_headers(client):
+    response, content = get(client, HASHED_NAME)
+    assert response.status_code == 200
+    assert content == CONTENT
+    assert response['Accept-Ranges'] == 'bytes'
+    assert response['ETag'] and response['Last-Modified']
+    assert 'immutable' in response['Cache-Control'], (
+        'Убедитесь, что файлы с хешем в имени отдаются с '
+        '`Cache-Control: immutable`.'
+    )
+    response, _ = get(client, 'plain.jpg')
+    assert 'immutable' not in response['Cache-Control']
+
+
+def test_conditional_requests(client):
+    response, _ = get(client, HASHED_NAME)
+    revalidated, content = get(
+        client, HASHED_NAME, HTTP_IF_NONE_MATCH=response['ETag']
+    )
+    assert revalidated.status_code == 304, (
+        'Убедитесь, что при совпадении `If-None-Match` возвращается 304.'
+    )
+    assert content == b''
+    revalidated, _ = get(
+        client, 'plain.jpg',
+        HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+    )
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.parametrize('header, start, end', (
+    ('bytes=0-99', 0, 99),
+    ('bytes=1000-', 1000, 1023),
+    ('bytes=-24', 1000, 1023),
+    ('bytes=1000-5000', 1000, 1023),
+))
+def test_range_requests(client, header, start, end):
+    response, content = get(client, HASHED_NAME, HTTP_RANGE=header)
+    assert response.status_code == 206, (
+        'Убедитесь, что запрос с заголовком `Range` получает ответ 206.'
+    )
+    assert content == CONTENT[start:end + 1]
+    assert response['Content-Range'] == f'bytes {start}-{end}/1024'
+
+
+def test_unsatisfiable_range(client):
+    response, _ = get(client, HASHED_NAME, HTTP_RANGE='bytes=2000-')
+    assert response.status_code == 416
+    assert response['Content-Range'] == 'bytes */1024'
+
+
+def test_stale_if_range_returns_full_file(client):
+    response, content = get(
+        client, HASHED_NAME, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"old"'
+    )
+    assert response.status_code == 200
+    assert content == CONTENT
+
+
+def test_sendfile_offload(client, settings, media_root):
+    settings.MEDIA_SENDFILE_HEADER = 'X-Accel-Redirect'
+    response, content = get(client, HASHED_NAME)
+    assert response['X-Accel-Redirect'] == (
+        settings.MEDIA_ACCEL_REDIRECT_PREFIX + HASHED_NAME
+    )
+    assert content == b''
+    settings.MEDIA_SENDFILE_HEADER = 'X-Sendfile'
+    response, _ = get(client, HASHED_NAME)
+    assert response['X-Sendfile'] == str(media_root / HASHED_NAME)
+
+
+@pytest.mark.parametrize('name', ('missing.jpg', '../settings.py', 'ab'))
+def test_missing_or_unsafe_paths(client, name):
+    response, _ = get(client, name)
+    assert response.status_code == 404
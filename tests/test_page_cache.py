@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.cache import INDEX_SCOPE, PAGES_SCOPE, page_cache_timeout
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_urls(published_post):
+    return (
+        '/',
+        f'/category/{published_post.category.slug}/',
+        '/pages/about/',
+        '/pages/rules/',
+    )
+
+
+def test_anonymous_pages_are_cached(client, feed_urls):
+    for url in feed_urls:
+        assert client.get(url)['X-Cache'] == 'MISS'
+        assert client.get(url)['X-Cache'] == 'HIT', (
+            f'Убедитесь, что страница `{url}` кешируется'
+            ' для анонимных читателей.'
+        )
+    assert client.get('/', {'page': 2})['X-Cache'] == 'MISS', (
+        'Убедитесь, что номер страницы входит в ключ кеша.'
+    )
+
+
+def test_logged_in_readers_bypass_page_cache(user_client, feed_urls):
+    for url in feed_urls:
+        user_client.get(url)
+        assert not user_client.get(url).has_header('X-Cache'), (
+            'Убедитесь, что страницы для авторизованных пользователей'
+            ' не кешируются целиком.'
+        )
+
+
+@pytest.mark.parametrize(
+    'change',
+    (
+        lambda post: post.comments.create(author=post.author, text='text'),
+        lambda post: post.category.save(),
+        lambda post: post.location.save(),
+        lambda post: post.delete(),
+    ),
+    ids=('comment', 'category', 'location', 'post'),
+)
+def test_page_cache_invalidation(client, published_post, change):
+    category_url = f'/category/{published_post.category.slug}/'
+    for url in ('/', category_url):
+        client.get(url)
+    change(published_post)
+    for url in ('/', category_url):
+        assert client.get(url)['X-Cache'] == 'MISS', (
+            f'Убедитесь, что кеш страницы `{url}` сбрасывается'
+            ' при изменении публикаций.'
+        )
+
+
+def test_new_post_invalidates_feeds(client, mixer, published_post):
+    client.get('/')
+    new_post = mixer.blend(
+        'blog.Post',
+        category=published_post.category,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(minutes=1),
+    )
+    response = client.get('/')
+    assert response['X-Cache'] == 'MISS'
+    assert new_post.title in response.content.decode()
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=60 * 60)
+def test_scheduled_post_caps_page_cache_ttl(mixer, published_post):
+    mixer.blend(
+        'blog.Post',
+        category=published_post.category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(seconds=30),
+    )
+    assert page_cache_timeout(INDEX_SCOPE) <= 31, (
+        'Убедитесь, что кеш ленты истекает к моменту публикации'
+        ' ближайшего отложенного поста.'
+    )
+    assert page_cache_timeout(PAGES_SCOPE) == 60 * 60
+
+
+def test_cache_control_respects_scheduled_post(client, mixer, published_post):
+    with override_settings(PAGE_MAX_AGE=60 * 60):
+        assert 'max-age=3600' in client.get('/')['Cache-Control']
+        mixer.blend(
+            'blog.Post',
+            category=published_post.category,
+            is_published=True,
+            pub_date=timezone.now() + timedelta(seconds=30),
+        )
+        for _ in range(2):
+            max_age = int(
+                client.get('/')['Cache-Control'].split('max-age=')[1]
+                .split(',')[0]
+            )
+            assert max_age <= 31, (
+                'Убедитесь, что заголовок Cache-Control ленты не позволяет'
+                ' кешировать её дольше, чем до публикации ближайшего'
+                ' отложенного поста.'
+            )
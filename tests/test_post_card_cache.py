@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import cache
+
+from blog.cache import post_card_cache_key
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_post_card_is_cached(client, user_client, published_post):
+    user_client.get('/')
+    cached = cache.get(post_card_cache_key(published_post.id))
+    assert cached and published_post.title in cached, (
+        'Убедитесь, что карточка публикации кешируется при выводе ленты.'
+    )
+    cache.set(post_card_cache_key(published_post.id), 'cached-card-marker')
+    for reader in (client, user_client):
+        assert 'cached-card-marker' in reader.get('/').content.decode(), (
+            'Убедитесь, что карточка публикации берётся из кеша'
+            ' для всех читателей.'
+        )
+
+
+@pytest.mark.parametrize(
+    'change',
+    (
+        lambda post: post.save(),
+        lambda post: post.category.save(),
+        lambda post: post.location.save(),
+        lambda post: post.comments.create(author=post.author, text='text'),
+    ),
+    ids=('post', 'category', 'location', 'comment'),
+)
+def test_post_card_cache_invalidation(user_client, published_post, change):
+    user_client.get('/')
+    assert cache.get(post_card_cache_key(published_post.id)) is not None
+    change(published_post)
+    assert cache.get(post_card_cache_key(published_post.id)) is None, (
+        'Убедитесь, что кеш карточки публикации сбрасывается при изменении'
+        ' публикации и связанных с ней объектов.'
+    )
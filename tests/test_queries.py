@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def make_feed(mixer, make_published_posts):
+    def make(size, **fields):
+        return make_published_posts(
+            size, location=lambda: mixer.blend('blog.Location'), **fields
+        )
+    return make
+
+
+def count_queries(client, url):
+    cache.clear()
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(captured)
+
+
+def test_category_page_queries_are_constant(
+        make_feed, user_client, published_category, another_category
+):
+    make_feed(2)
+    make_feed(N_PER_PAGE, category=another_category)
+    small = count_queries(
+        user_client, f'/category/{published_category.slug}/'
+    )
+    large = count_queries(
+        user_client, f'/category/{another_category.slug}/'
+    )
+    assert small == large, (
+        'Убедитесь, что число запросов к БД на странице категории не зависит'
+        ' от количества публикаций на странице.'
+    )
+
+
+def test_unpublished_category_skips_posts_query(
+        make_feed, user_client, published_category
+):
+    make_feed(2)
+    published_category.is_published = False
+    published_category.save()
+    url = f'/category/{published_category.slug}/'
+    with CaptureQueriesContext(connection) as captured:
+        assert user_client.get(url).status_code == 404
+    assert not any(
+        'blog_post' in query['sql'] for query in captured.captured_queries
+    ), (
+        'Убедитесь, что для неопубликованной категории публикации'
+        ' не запрашиваются из БД.'
+    )
+
+
+def test_profile_page_queries_are_constant(
+        make_feed, user, another_user, user_client
+):
+    make_feed(2)
+    make_feed(N_PER_PAGE, author=another_user)
+    small = count_queries(user_client, f'/profile/{user.username}/')
+    large = count_queries(user_client, f'/profile/{another_user.username}/')
+    assert small == large, (
+        'Убедитесь, что число запросов к БД на странице профиля не зависит'
+        ' от количества публикаций на странице.'
+    )
+
+
+def test_profile_summary(mixer, make_feed, user, user_client):
+    posts = make_feed(3)
+    for post in posts[:2]:
+        mixer.blend('blog.Comment', post=post)
+    summary = user_client.get(
+        f'/profile/{user.username}/'
+    ).context['profile_summary']
+    assert summary['post_total'] == 3
+    assert summary['comment_total'] == 2
+    assert summary['last_activity'] == max(post.pub_date for post in posts)
+
+
+def test_profile_summary_ignores_scheduled_posts(make_feed, user,
+                                                 user_client):
+    posts = make_feed(2)
+    make_feed(1, pub_date=timezone.now() + timedelta(days=3))
+    summary = user_client.get(
+        f'/profile/{user.username}/'
+    ).context['profile_summary']
+    assert summary['post_total'] == 3
+    assert summary['last_activity'] == max(post.pub_date for post in posts), (
+        'Убедитесь, что отложенные публикации не учитываются в последней '
+        'активности.'
+    )
@@ -0,0 +1,114 @@
+import sqlite3
+
+import pytest
+from django.db import connections
+
+from blog.models import Post
+from blog.routers import PRIMARY_PIN_COOKIE, ReplicaRouter, route_reads
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+
+@pytest.fixture
+def replicas(settings, tmp_path):
+    aliases = []
+
+    def sync():
+        primary = connections['default']
+        primary.ensure_connection()
+        for alias in aliases:
+            connections[alias].close()
+            target = sqlite3.connect(tmp_path / f'{alias}.sqlite3')
+            primary.connection.backup(target)
+            target.close()
+
+    for index in range(2):
+        alias = f'replica_{index}'
+        connections.databases[alias] = dict(
+            connections['default'].settings_dict,
+            NAME=str(tmp_path / f'{alias}.sqlite3'),
+        )
+        aliases.append(alias)
+    settings.DATABASE_REPLICAS = aliases
+    yield sync
+    for alias in aliases:
+        connections[alias].close()
+        del connections[alias]
+        del connections.databases[alias]
+
+
+def test_router_uses_primary_outside_requests(replicas):
+    router = ReplicaRouter()
+    assert router.db_for_read(Post) == 'default'
+    with route_reads('replica_0'):
+        assert router.db_for_read(Post) == 'replica_0'
+        assert router.db_for_write(Post) == 'default'
+        assert router.db_for_read(Post) == 'default', (
+            'Убедитесь, что после записи чтение в том же запросе '
+            'идёт в основную базу.'
+        )
+
+
+def test_feed_reads_from_replica(client, replicas, make_published_post, user):
+    replicated = make_published_post(title='Старая запись')
+    replicas()
+    fresh = make_published_post(title='Свежая запись')
+    content = client.get(f'/profile/{user.username}/').content.decode()
+    assert replicated.title in content
+    assert fresh.title not in content, (
+        'Убедитесь, что анонимные GET-запросы читают из реплики.'
+    )
+
+
+def test_page_cache_is_rebuilt_from_primary(client, replicas,
+                                            make_published_post):
+    make_published_post(title='Старая запись')
+    replicas()
+    fresh = make_published_post(title='Свежая запись')
+    for _ in range(2):
+        assert fresh.title in client.get('/').content.decode(), (
+            'Убедитесь, что кешируемые страницы собираются из основной '
+            'базы, а не из отстающей реплики.'
+        )
+
+
+def test_reads_pinned_to_primary_after_write(user_client, replicas,
+                                             make_published_post):
+    post = make_published_post(title='Запись')
+    replicas()
+    response = user_client.post(
+        f'/posts/{post.pk}/comment/', {'text': 'Новый комментарий'}
+    )
+    assert PRIMARY_PIN_COOKIE in response.cookies, (
+        'Убедитесь, что после записи пользователь закрепляется '
+        'за основной базой.'
+    )
+    content = user_client.get(f'/posts/{post.pk}/').content.decode()
+    assert 'Новый комментарий' in content, (
+        'Убедитесь, что пользователь видит свои изменения сразу '
+        'после записи.'
+    )
+    user_client.cookies.pop(PRIMARY_PIN_COOKIE)
+    content = user_client.get(f'/posts/{post.pk}/').content.decode()
+    assert 'Новый комментарий' not in content
+
+
+def test_replica_choice_spreads_reads(client, replicas, make_published_post,
+                                      monkeypatch):
+    make_published_post(title='Запись')
+    replicas()
+    chosen = []
+
+    def choose(aliases):
+        chosen.append(aliases[len(chosen) % len(aliases)])
+        return chosen[-1]
+
+    monkeypatch.setattr('blog.middleware.random.choice', choose)
+    for _ in range(4):
+        client.get('/category/missing/')
+    assert chosen == ['replica_0', 'replica_1'] * 2
+
+
+def test_replicas_disabled_by_default(client, make_published_post):
+    post = make_published_post(title='Запись')
+    assert post.title in client.get('/').content.decode()
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, connections
+from django.utils import timezone
+
+from blog import search
+from blog.models import Post
+from blog.search import SEARCH_TABLE, search_posts
+
+pytestmark = [pytest.mark.django_db]
+
+
+def found(client, query, **params):
+    response = client.get('/search/', {'q': query, **params})
+    assert response.status_code == 200
+    return [post.pk for post in response.context['page_obj']]
+
+
+def test_search_ranks_title_matches_first(client, make_published_post):
+    in_text = make_published_post(
+        title='Прогулка', text='Видели высокие горы и реку'
+    )
+    in_title = make_published_post(
+        title='Горы Кавказа', text='Заметки о поездке'
+    )
+    make_published_post(title='Море', text='Тёплая вода')
+    assert found(client, 'горы') == [in_title.pk, in_text.pk], (
+        'Убедитесь, что поиск находит публикации по заголовку и тексту '
+        'и ставит совпадения в заголовке выше.'
+    )
+
+
+def test_search_respects_visibility(client, make_published_post, mixer):
+    make_published_post(title='Скрытая горы', text='текст',
+                        is_published=False)
+    make_published_post(title='Будущие горы', text='текст',
+                        pub_date=timezone.now() + timedelta(days=1))
+    make_published_post(title='Горы в скрытой категории', text='текст',
+                        category=mixer.blend('blog.Category',
+                                             is_published=False))
+    visible = make_published_post(title='Горы', text='текст')
+    assert found(client, 'горы') == [visible.pk], (
+        'Убедитесь, что поиск показывает только опубликованные записи.'
+    )
+
+
+def test_index_updates_on_save_and_delete(client, make_published_post):
+    post = make_published_post(title='Озеро', text='Спокойная вода')
+    assert found(client, 'озеро') == [post.pk]
+    post.title = 'Водопад'
+    post.save()
+    assert found(client, 'озеро') == []
+    assert found(client, 'водопад') == [post.pk]
+    post.delete()
+    assert found(client, 'водопад') == []
+
+
+def test_search_paginates(client, make_published_posts, settings):
+    posts = make_published_posts(
+        12,
+        title=(f'Пост {index}' for index in range(12)),
+        text='общий текст',
+    )
+    first_page = found(client, 'общий')
+    second_page = found(client, 'общий', page=2)
+    assert len(first_page) == settings.POSTS_BY_PAGE
+    assert set(first_page + second_page) == {post.pk for post in posts}
+
+
+@pytest.mark.parametrize('query', ('', '"*', 'AND OR NOT'))
+def test_search_handles_odd_queries(client, make_published_post, query):
+    make_published_post(title='Горы', text='текст')
+    found(client, query)
+
+
+def test_rebuild_search_index(client, make_published_post):
+    post = make_published_post(title='Лес', text='Тропинка')
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    assert found(client, 'лес') == []
+    call_command('rebuild_search_index', stdout=open('/dev/null', 'w'))
+    assert found(client, 'лес') == [post.pk]
+
+
+def test_search_uses_queryset_database(make_published_post, monkeypatch):
+    used = []
+    get_backend = search.get_backend
+
+    def spy(connection=None):
+        used.append(connection)
+        return get_backend(connection)
+
+    monkeypatch.setattr(search, 'get_backend', spy)
+    post = make_published_post(title='Лес', text='Тропинка')
+    found = search_posts(Post.objects.using('default'), 'лес')
+    assert [item.pk for item in found] == [post.pk]
+    assert used and all(
+        connection is connections['default'] for connection in used
+    ), (
+        'Убедитесь, что поиск и индексация работают с базой данных '
+        'запроса, а не с базой по умолчанию.'
+    )
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+
+from blog.checks import production_settings_errors
+
+PROBE = (
+    'import json, django; django.setup(); '
+    'from django.conf import settings as s; '
+    'print(json.dumps({"debug": s.DEBUG, "hosts": s.ALLOWED_HOSTS, '
+    '"loaders": s.TEMPLATES[0]["OPTIONS"].get("loaders"), '
+    '"cache": s.CACHES["default"]["BACKEND"], '
+    '"media": s.MEDIA_SERVE, "warm": s.WARM_TEMPLATES}))'
+)
+
+
+def boot(**env):
+    environment = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith(('BLOGICUM_', 'DJANGO_'))
+    }
+    environment.update(env, DJANGO_SETTINGS_MODULE='blogicum.settings')
+    return subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=settings.BASE_DIR,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_dev_is_default():
+    result = boot()
+    assert result.returncode == 0, result.stderr
+    probe = json.loads(result.stdout)
+    assert probe['debug'] is True
+    assert probe['warm'] is False
+
+
+def test_prod_settings(tmp_path):
+    result = boot(
+        BLOGICUM_ENV='prod',
+        DJANGO_SECRET_KEY='x' * 50,
+        DJANGO_ALLOWED_HOSTS='example.com, www.example.com',
+        DJANGO_CACHE_DIR=str(tmp_path),
+    )
+    assert result.returncode == 0, result.stderr
+    probe = json.loads(result.stdout)
+    assert probe['debug'] is False
+    assert probe['hosts'] == ['example.com', 'www.example.com']
+    assert probe['loaders'][0][0] == 'django.template.loaders.cached.Loader', (
+        'Убедитесь, что в боевом окружении шаблоны кешируются.'
+    )
+    assert 'locmem' not in probe['cache']
+    assert probe['media'] is False
+    assert probe['warm'] is True, (
+        'Убедитесь, что в боевом окружении шаблоны прогреваются при запуске.'
+    )
+
+
+def test_prod_refuses_to_boot_misconfigured():
+    result = boot(BLOGICUM_ENV='prod', DJANGO_SECRET_KEY='x' * 50)
+    assert result.returncode != 0
+    assert 'blog.E006' in result.stderr, (
+        'Убедитесь, что боевое окружение не запускается без ALLOWED_HOSTS.'
+    )
+
+
+def test_unknown_environment_is_rejected():
+    result = boot(BLOGICUM_ENV='staging')
+    assert result.returncode != 0
+    assert 'BLOGICUM_ENV' in result.stderr
+
+
+@pytest.mark.parametrize('overrides, error_id', (
+    ({'DEBUG': True}, 'blog.E001'),
+    ({'MIDDLEWARE': [*settings.MIDDLEWARE,
+                     'debug_toolbar.middleware.DebugToolbarMiddleware']},
+     'blog.E002'),
+    ({}, 'blog.E003'),
+    ({}, 'blog.E005'),
+    ({'ALLOWED_HOSTS': []}, 'blog.E006'),
+    ({}, 'blog.E007'),
+))
+def test_production_checks(settings, overrides, error_id):
+    settings.BLOGICUM_ENV = 'prod'
+    settings.ALLOWED_HOSTS = ['example.com']
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    assert error_id in {error.id for error in production_settings_errors()}
+
+
+def test_production_checks_skip_dev(settings):
+    settings.DEBUG = True
+    assert production_settings_errors() == []
@@ -0,0 +1,44 @@
+import pytest
+from django.db import connections
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def file_connection(tmp_path):
+    alias = 'tuning'
+    connections.databases[alias] = dict(
+        connections['default'].settings_dict,
+        NAME=str(tmp_path / 'tuning.sqlite3'),
+    )
+    yield connections[alias]
+    connections[alias].close()
+    del connections[alias]
+    del connections.databases[alias]
+
+
+def pragma(connection, name):
+    with connection.cursor() as cursor:
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+
+def test_sqlite_pragmas_applied(file_connection):
+    assert pragma(file_connection, 'journal_mode') == 'wal', (
+        'Убедитесь, что для SQLite включается режим WAL.'
+    )
+    assert pragma(file_connection, 'synchronous') == 1
+    assert pragma(file_connection, 'busy_timeout') == 20_000
+    assert pragma(file_connection, 'cache_size') == -64 * 2 ** 10
+    assert pragma(file_connection, 'mmap_size') == 256 * 2 ** 20
+
+
+def test_pragmas_can_be_disabled(file_connection, settings):
+    settings.SQLITE_PRAGMAS = {}
+    assert pragma(file_connection, 'journal_mode') == 'delete'
+
+
+def test_persistent_connections(settings):
+    assert settings.DATABASES['default']['CONN_MAX_AGE'] > 0, (
+        'Убедитесь, что соединения с базой данных переиспользуются.'
+    )
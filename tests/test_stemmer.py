@@ -0,0 +1,46 @@
+import pytest
+
+from blog.search import tokenize
+from blog.stemmer import stem
+
+
+@pytest.mark.parametrize('word, expected', (
+    ('горы', 'гор'),
+    ('горах', 'гор'),
+    ('кавказа', 'кавказ'),
+    ('красивейший', 'красив'),
+    ('бегущая', 'бегущ'),
+    ('прогулялись', 'прогуля'),
+    ('обедали', 'обеда'),
+    ('радостью', 'радост'),
+    ('ёлки', 'елк'),
+    ('вода', 'вод'),
+    ('мгла', 'мгла'),
+))
+def test_stem(word, expected):
+    assert stem(word) == expected, (
+        'Убедитесь, что стеммер отсекает окончания по алгоритму Snowball.'
+    )
+
+
+def test_tokenize_folds_and_drops_stopwords():
+    assert tokenize('Ёлки и горы, а также ЛЕС') == ['елк', 'гор', 'лес']
+
+
+@pytest.mark.django_db
+def test_search_matches_inflected_forms(client, mixer, user,
+                                        published_category):
+    post = mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        is_published=True,
+        title='Прогулка',
+        text='Мы долго гуляли по горам и ели ёлочные шишки.',
+        image='',
+    )
+    for query in ('горы', 'гора', 'елочные'):
+        response = client.get('/search/', {'q': query})
+        assert list(response.context['page_obj']) == [post], (
+            'Убедитесь, что поиск находит словоформы запроса.'
+        )
@@ -0,0 +1,49 @@
+from copy import deepcopy
+
+import pytest
+from django.core.management import call_command
+from django.template import engines
+
+from blog.warmup import template_names, warm_templates
+
+CACHED_LOADERS = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+
+@pytest.fixture
+def cached_templates(settings):
+    templates = deepcopy(settings.TEMPLATES)
+    templates[0]['APP_DIRS'] = False
+    templates[0]['OPTIONS']['loaders'] = CACHED_LOADERS
+    settings.TEMPLATES = templates
+    return engines['django']
+
+
+def test_template_names_cover_project_templates():
+    names = template_names(engines['django'])
+    for name in ('base.html', 'blog/index.html', 'includes/header.html',
+                 'includes/post_card.html', 'pages/about.html'):
+        assert name in names, (
+            f'Убедитесь, что шаблон `{name}` прогревается при запуске.'
+        )
+    assert not any(name.startswith('admin/') for name in names)
+
+
+def test_warm_templates_fills_loader_cache(cached_templates):
+    loader = cached_templates.engine.template_loaders[0]
+    assert not loader.get_template_cache
+    names = warm_templates()
+    assert set(names) <= set(loader.get_template_cache), (
+        'Убедитесь, что после прогрева все шаблоны находятся в кеше '
+        'загрузчика.'
+    )
+
+
+def test_warm_templates_command(cached_templates, capsys):
+    call_command('warm_templates')
+    count = len(template_names(cached_templates))
+    assert str(count) in capsys.readouterr().out
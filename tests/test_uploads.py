@@ -0,0 +1,56 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from PIL import Image
+
+from blog.forms import PostForm
+
+pytestmark = [
+    pytest.mark.django_db, pytest.mark.usefixtures('media_root')
+]
+
+
+def make_upload(width, height):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), 'green').save(buffer, 'PNG')
+    return SimpleUploadedFile('photo.png', buffer.getvalue())
+
+
+def post_data(category):
+    return {
+        'title': 'Заголовок',
+        'text': 'Текст',
+        'pub_date': timezone.localtime().strftime('%Y-%m-%dT%H:%M'),
+        'category': category.id,
+        'is_published': True,
+    }
+
+
+def test_pixel_limit_checked_without_decoding(settings, published_category):
+    settings.MAX_IMAGE_PIXELS = 100 * 100
+    form = PostForm(
+        data=post_data(published_category),
+        files={'image': make_upload(200, 200)}
+    )
+    assert not form.is_valid()
+    assert form.errors['image'][0].startswith('Картинка слишком большая')
+
+
+def test_oversized_upload_is_rejected(
+        settings, user_client, published_category
+):
+    settings.MAX_IMAGE_UPLOAD_SIZE = 1024
+    upload = make_upload(800, 800)
+    assert upload.size > 1024
+    response = user_client.post(
+        '/posts/create/', {**post_data(published_category), 'image': upload}
+    )
+    assert response.status_code == 200
+    assert response.context['form'].errors['image'][0].startswith(
+        'Размер файла не должен превышать'
+    ), (
+        'Убедитесь, что слишком большие файлы отклоняются с понятной'
+        ' ошибкой.'
+    )